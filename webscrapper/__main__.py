@@ -1,4 +1,9 @@
-from main import main
+import sys
+
+from main import main, reparse
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["reparse"]:
+        reparse()
+    else:
+        main()
@@ -5,7 +5,15 @@ def main() -> None:
 
     try:
         print("WEBSCRAPPER")
-        exhibitorlist.scrap(1, 737)
-        exhibitorlist.translate()
+        exhibitorlist.run(1, 737)
+    except Exception as e:
+        print(f"FATAL EXCEPTION: {e}")
+
+
+def reparse() -> None:
+
+    try:
+        print("WEBSCRAPPER REPARSE")
+        exhibitorlist.reparse()
     except Exception as e:
         print(f"FATAL EXCEPTION: {e}")
@@ -1,293 +1,480 @@
-import time
-from typing import cast
-
-from webscrapper.browser import Browser, WebElement
-from webscrapper.excel import Excel, Worksheet
-from webscrapper.scrapper import Content, ResultSet, Scrapper, Tag
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+from webscrapper.browser import Browser, BrowserPool, WebElement
+from webscrapper.cache import ResponseCache
+from webscrapper.checkpoint import Checkpoint
+from webscrapper.excel import Excel
+from webscrapper.memory import TranslationMemory
+from webscrapper.fetcher import HttpFetcher
+from webscrapper.pipeline import Pipeline, Stage
+from webscrapper.scrapper import Content, Field, Schema, Scrapper, Tag
+from webscrapper.sink import JsonLinesSink, Sink
 from webscrapper.translator import Translator
 from webscrapper.utils import Files, Timer
 
 file_name: str = "exhibitorlist"
 
+parser: str = "lxml"
 
-def scrap(page_start: int = 1, page_end: int = 737) -> None:
-
-    def get_sheet_number(page: int) -> int:
-        return 0 if page < 100 else page // 100
-
-    def get_row(record_number: int, sheet_number: int) -> int:
-        index: int = record_number
-
-        if record_number <= 99:
-            index = record_number + 1
-        else:
-            index -= (12 * 99) + (12 * 100 * (sheet_number - 1)) - 1
-
-        return index
-
-    def get_sheet(excel: Excel, name: str) -> Worksheet:
-        if not excel.has_sheet(name):
-            excel.create_sheet(name)
-
-        sheet: Worksheet = excel.get_sheet(name)
-
-        sheet["A1"] = "done"
-        sheet["B1"] = "page"
-        sheet["C1"] = "number"
-        sheet["D1"] = "text"
-        sheet["E1"] = "images"
-        sheet["F1"] = "videos"
-        sheet["G1"] = "links"
-        sheet["H1"] = "company"
-        sheet["I1"] = "address"
-        sheet["J1"] = "website"
-        sheet["K1"] = "logo"
-        sheet["L1"] = "url"
-        sheet["M1"] = "error"
-
-        return sheet
-
-    def go_to_page(browser: Browser, page: int = 0) -> int | None:
-        success: bool = False
-        attempts: int = 0
-
-        while not success and attempts < 3:
-            button_number: int = 0
-
-            try:
-                browser.wait_css_clickable(".layui-laypage-next")
-
-                next_button: WebElement | None = browser.find_one_by_css(".layui-laypage-next")
-
-                if next_button:
-                    if page > 0:
-                        browser.set_attribute(next_button, "data-page", str(page))
-                    button_number = int(next_button.get_attribute("data-page") or "0")
-                    print(f"Going to page {button_number}")
-                    browser.click_element(next_button)
-                    success = True
-            except Exception as e:
-                attempts += 1
-                print(f"Error going to page: {e}")
-                time.sleep(5)
-
-        if success:
-            return button_number
-        else:
-            raise Exception(f"It was not possible to go to the page {page}")
-
-    print(file_name)
-    print(f"Scrapping pages from {page_start} to {page_end}")
-
-    excel: Excel = Excel(file_name)
-    Files.copy_file(f"{file_name}.xlsx", f"{file_name}_backup.xlsx")
-
-    sheet_number: int = get_sheet_number(page_start)
-    sheet: Worksheet = get_sheet(excel, str(sheet_number))
-
-    browser: Browser = Browser()
-    browser.go_to_url("https://www.cmef.com.cn/exhibitorlist?type=1", 5)
-
-    page: int = go_to_page(browser, page_start) or 1
+columns: List[str] = ["done", "page", "number", "text", "images", "videos", "links", "company", "address", "website", "logo", "url", "error"]
 
-    record_number: int = (page - 1) * 12
-    row: int = get_row(record_number, sheet_number)
-
-    error_number: int = 0
+translated_columns: List[str] = columns + ["translated", "text_es", "company_es"]
 
-    while error_number < 5:
-        print(f"{'_' * 5} Page {page} {'_' * 5}")
 
-        browser.wait_css_present(".exc-item.clearfix")
-        browser.wait_css_present(".exc-item-title.inner")
+def get_sheet_number(page: int) -> int:
+    return 0 if page < 100 else page // 100
 
-        scrapper: Scrapper = Scrapper(browser.get_page_source_code())
 
-        scrapper.delete_tags("head")
+@dataclass
+class Record:
 
-        items_parent: Tag | None = scrapper.find_one("div", "exl-r")
+    page: int
+    number: int
+    url: str
+    done: str = "NO"
+    text: str = "\u274C"
+    images: str = "\u274C"
+    videos: str = "\u274C"
+    links: str = "\u274C"
+    company: str = "\u274C"
+    address: str = "\u274C"
+    website: str = "\u274C"
+    logo: str = "\u274C"
+    error: str = '=""'
+    failures: int = 0
 
-        if items_parent:
-            scrapper.set_root(items_parent)
+    def to_dict(self) -> dict[str, Any]:
+        record: dict[str, Any] = {column: getattr(self, column) for column in columns}
+        record["url"] = self.url or "\u274C"
+        record["attempts"] = self.failures + (1 if self.done == "YES" else 0)
+        return record
 
-            items: ResultSet[Tag] | None = items_parent.find_all("div", class_=["company-item"])
 
-            if not items:
-                raise Exception("Cards not found")
-            else:
-                for item_index in range(len(items)):
+class Workers:
 
-                    timer = Timer()
-                    timer.start_timer()
+    def __init__(self, size: int, render: bool = True, cache: ResponseCache | None = None, tabs: int = 3, max_pages: int = 500) -> None:
+        """
+        Create the state shared by the threads that scrap detail pages: an HTTP fetcher per thread and a pool of browsers.
 
-                    record_number += 1
-                    row += 1
+        Args:
+            size (int): number of browsers, which block stylesheets, fonts, media and analytics
+            render (bool): render every detail page with the browser. Otherwise it is fetched through plain HTTP and the browser is only used when that fails. True by default
+            cache (ResponseCache | None): cache of detail pages source code. None by default
+            tabs (int): warm tabs per browser, loading the next detail pages while the current one is read. 3 by default
+            max_pages (int): detail pages browsed before a browser is recycled. 500 by default
+        """
+        self.__render: bool = render
+        self.__cache: ResponseCache | None = cache
+        self.__local: threading.local = threading.local()
+        self.__browsers: BrowserPool = BrowserPool(size, block_resources=True, tabs=tabs, max_pages=max_pages)
+        self.__fetchers: List[HttpFetcher] = []
+        self.__lock: threading.Lock = threading.Lock()
 
-                    print(f"{'=' * 3} Record {record_number} | Item {item_index + 1} {'=' * 3}")
+    @property
+    def browsers(self) -> BrowserPool:
+        return self.__browsers
 
-                    is_done: bool = sheet[f"A{row}"].value == "YES"
+    def get_fetcher(self) -> HttpFetcher:
+        """
+        Return the HTTP fetcher of the current thread, starting it the first time.
 
-                    if is_done:
-                        print("Already browsed")
-                    else:
+        Returns:
+            HttpFetcher
+        """
+        current: HttpFetcher | None = getattr(self.__local, "fetcher", None)
 
-                        item: Tag = items[item_index]
+        if current is not None:
+            return current
 
-                        done: str = "YES"
-                        text: str = "\u274C"
-                        images: str = "\u274C"
-                        videos: str = "\u274C"
-                        links: str = "\u274C"
-                        company: str = "\u274C"
-                        address: str = "\u274C"
-                        website: str = "\u274C"
-                        logo: str = "\u274C"
-                        url: str = "\u274C"
-                        error: str = '=""'
+        fetcher: HttpFetcher = HttpFetcher(cache=self.__cache)
+        self.__local.fetcher = fetcher
+        with self.__lock:
+            self.__fetchers.append(fetcher)
 
-                        success: bool = False
-                        attempts: int = 0
+        return fetcher
 
-                        while not success and attempts < 3:
-                            print(f"< Attempt {attempts + 1} >")
+    @property
+    def render(self) -> bool:
+        return self.__render
 
-                            try:
-                                # title_element: PageElement | None = card.find("div", class_=["exc-item-title"], title=True)
-                                # title = title_element.text if title_element else ""
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self.__cache
 
-                                # if not title:
-                                #     title = "\u274C"
-                                #     raise Exception("Title not found")
+    def shutdown(self) -> None:
+        """
+        Quit every browser and close every HTTP session.
+        """
+        self.__browsers.close()
 
-                                url_element: Tag | None = item.div or None
-                                unprocessed_url: list[str] | str = url_element["data-href"] if url_element else ""
-                                url = unprocessed_url if isinstance(unprocessed_url, str) else "".join(unprocessed_url)
+        for fetcher in self.__fetchers:
+            fetcher.close()
 
-                                if not url:
-                                    raise Exception("URL attribute not found")
-                                else:
-                                    url = f"https://www.cmef.com.cn/{url}"
 
-                                    browser.open_tab(url)
-                                    browser.go_to_tab(2)
+def open_company(browser: Browser, url: str) -> None:
+    """
+    Open the company detail page at url on the browser and wait for it to be rendered.
 
-                                    browser.wait_css_present(".company-header>.img")
-                                    browser.wait_css_present(".title-container>h2")
-                                    browser.wait_css_present(".address")
-                                    browser.wait_css_present(".website")
-                                    browser.wait_css_present(".company-detail")
+    Args:
+        browser (Browser): browser used to open the page
+        url (str): company detail page url
+    """
+    browser.go_to_url(url)
+
+    wait_company(browser)
+
+
+def wait_company(browser: Browser) -> None:
+    """
+    Wait for the company detail page at the current tab to be rendered.
+
+    Args:
+        browser (Browser): browser with the page
+    """
+    present: List[str] = browser.wait_all_present([".company-header>.img", ".title-container>h2", ".address", ".website", ".company-detail"])
+
+    if ".company-detail" not in present:
+        raise Exception("Company detail not found")
+
+
+def render_company(browser: Browser, url: str | None = None) -> str:
+    """
+    Open the company detail page at url on the browser and return its rendered source code.
+
+    Args:
+        browser (Browser): browser used to open the page
+        url (str | None): company detail page url. The page already loading at the current tab by default
+    Returns:
+        str
+    """
+    if url:
+        open_company(browser, url)
+    else:
+        wait_company(browser)
+
+    browser.delete_scripts()
+
+    return browser.get_page_source_code()
+
+
+def get_item_url(item: Tag) -> str:
+    url_element: Tag | None = item.div or None
+    unprocessed_url: list[str] | str = url_element.get("data-href", "") if url_element else ""
+    url: str = unprocessed_url if isinstance(unprocessed_url, str) else "".join(unprocessed_url)
+    return f"https://www.cmef.com.cn/{url}" if url else ""
+
+
+items_schema: Schema = Schema(
+    {
+        "urls": Field("div.company-item", tag=True, many=True, required=True, process=get_item_url),
+    }
+)
 
-                                    browser.delete_scripts()
+company_schema: Schema = Schema(
+    {
+        "content": Field("div.section div.comp-detail", tag=True, required=True),
+        "company": Field("div.company-header div.title-container h2", required=True),
+        "address": Field("div.company-header div.title-container p.address span", default=""),
+        "website": Field("div.company-header div.title-container p.website a", default=""),
+        "logo": Field("div.company-header img", attribute="src", default=""),
+    }
+)
 
-                                    second_scrapper: Scrapper = Scrapper(browser.get_page_source_code())
 
-                                    second_scrapper.delete_tags("head")
+def extract_company(source_code: str, record: Record) -> None:
+    """
+    Extract the company fields from the detail page source code and fill the record.
 
-                                    company_detail: Tag | None = second_scrapper.find_one("div", "company-detail")
+    Args:
+        source_code (str): company detail page source code
+        record (Record): record to fill
+    """
+    scrapper: Scrapper = Scrapper(source_code, parser, "div.company-detail")
 
-                                    if not company_detail:
-                                        raise Exception("Company detail not found")
-                                    else:
-                                        second_scrapper.set_root(company_detail)
+    company_detail: Tag | None = scrapper.find_one("div", "company-detail")
 
-                                        section_element: Tag | None = second_scrapper.find_one("div", "section")
+    if not company_detail:
+        raise Exception("Company detail not found")
 
-                                        if not section_element:
-                                            raise Exception("Section content not found")
-                                        else:
+    fill_record(scrapper.extract(company_schema, company_detail), record)
+
+
+def fill_record(values: dict[str, Any], record: Record) -> None:
+    """
+    Fill the record with the values extracted with the company schema.
+
+    Args:
+        values (dict[str, Any]): company schema values
+        record (Record): record to fill
+    """
+    content: Content = Scrapper.get_content(values["content"])
 
-                                            content_element: Tag | None = cast(Tag, section_element.find("div", "comp-detail"))
+    record.text = content.text
+    record.images = content.images
+    record.videos = content.videos
+    record.links = content.links
+    record.company = values["company"]
+    record.address = values["address"]
+    record.website = values["website"]
+    record.logo = values["logo"]
+
+
+def load_record(workers: Workers, record: Record) -> bool:
+    """
+    Fill the record from its detail page fetched through plain HTTP when rendering is off; the fetcher revalidates cached pages with ETag and Last-Modified and only downloads the ones that changed. When rendering is on, a cached rendered page is used as it is, since it has no validators.
+
+    Args:
+        workers (Workers): pool that owns the HTTP fetcher of the current thread
+        record (Record): record to fill
+    Returns:
+        bool; False if the detail page needs to be rendered
+    """
+    if not record.url:
+        raise Exception("URL attribute not found")
+
+    if not workers.render:
+        try:
+            extract_company(workers.get_fetcher().get_page_source_code(record.url), record)
+            return True
+        except Exception as e:
+            print(f"Record {record.number} needs to be rendered: {e}")
+
+        return False
+
+    source_code: str | None = workers.cache.get(record.url) if workers.cache is not None else None
+
+    if source_code is not None:
+        try:
+            extract_company(source_code, record)
+            return True
+        except Exception as e:
+            print(f"Cached record {record.number} can't be parsed: {e}")
+
+    return False
 
-                                            if not content_element:
-                                                raise Exception("Content not found")
-                                            else:
-                                                content: Content = second_scrapper.get_content(content_element)
 
-                                                text = content.text
-                                                images = content.images
-                                                videos = content.videos
-                                                links = content.links
+def render_record(workers: Workers, browser: Browser, record: Record, loading: bool = False) -> None:
+    """
+    Fill the record from its detail page rendered on the browser, caching the page if there is a cache.
+
+    Args:
+        workers (Workers): pool that owns the cache
+        browser (Browser): browser of the current thread
+        record (Record): record to fill
+        loading (bool): the detail page is already loading at the current tab. False by default
+    """
+    if workers.cache is None:
+        if loading:
+            wait_company(browser)
+        else:
+            open_company(browser, record.url)
+        fill_record(browser.extract(company_schema, "div.company-detail"), record)
+    else:
+        source_code: str = render_company(browser, None if loading else record.url)
+        workers.cache.put(record.url, source_code)
+        extract_company(source_code, record)
+
+
+def scrap_record(workers: Workers, record: Record, browser: Browser | None = None) -> Record:
+    """
+    Scrap the detail page of a record with up to three attempts.
+
+    Args:
+        workers (Workers): pool that owns the browsers
+        record (Record): record to scrap
+        browser (Browser | None): browser already taken from the pool. One is taken only if the page needs rendering by default
+    Returns:
+        Record
+    """
+    success: bool = False
+    acquired: Browser | None = None
+    pages: int = 0
+
+    try:
+        while not success and record.failures < 3:
+            print(f"< Record {record.number} | Attempt {record.failures + 1} >")
+
+            try:
+                if not load_record(workers, record):
+                    if browser is None:
+                        browser = acquired = workers.browsers.acquire()
+                    pages += 1
+                    render_record(workers, browser, record)
 
-                                        company_header: Tag | None = second_scrapper.find_one("div", ["company-header"])
+                record.done = "YES"
+                record.error = '=""'
+                success = True
 
-                                        if not company_header:
-                                            raise Exception("Company element not found")
-                                        else:
+            except Exception as e:
+                record.failures += 1
+                record.done = "NO"
+                record.error = str(e)
 
-                                            title_container: Tag | None = cast(Tag, company_header.find("div", class_="title-container"))
+                print(f"\u274C Error on record {record.number}:", e)
 
-                                            if title_container:
-                                                name_element: Tag | None = title_container.h2 if title_container else None
-                                                company = name_element.text if name_element else ""
+                if acquired is not None and not acquired.is_alive():
+                    workers.browsers.release(acquired, pages)
+                    browser = acquired = None
+                    pages = 0
+    finally:
+        if acquired is not None:
+            workers.browsers.release(acquired, pages)
 
-                                                if not company:
-                                                    raise Exception("Name not found")
+    return record
 
-                                                address_element_parent: Tag | None = cast(Tag, title_container.find("p", class_="address"))
-                                                address_element: Tag | None = address_element_parent.span if address_element_parent else None
-                                                address = address_element.text if address_element else ""
 
-                                                website_element_parent: Tag | None = cast(Tag, title_container.find("p", class_="website"))
-                                                website_element: Tag | None = website_element_parent.a if website_element_parent else None
-                                                website = website_element.text if website_element else ""
+def scrap_records(workers: Workers, records: List[Record], futures: List[Future[Record]]) -> None:
+    """
+    Scrap the detail pages of many records on the current thread. Records that need rendering are loaded ahead in the warm tabs of a browser from the pool, so each page is read while the next ones load; failed ones are retried with scrap_record.
 
-                                            logo_element: Tag | None = cast(Tag, company_header.find("img"))
-                                            unprocessed_logo: list[str] | str = logo_element["src"] if logo_element else ""
-                                            logo = unprocessed_logo if isinstance(unprocessed_logo, str) else "".join(unprocessed_logo)
+    Args:
+        workers (Workers): pool that owns the browsers
+        records (List[Record]): records to scrap
+        futures (List[Future[Record]]): future of each record, completed as soon as it is scrapped
+    """
+    try:
+        rendered: List[tuple[Record, Future[Record]]] = []
 
-                                    browser.close_tab()
+        for record, future in zip(records, futures):
+            try:
+                if load_record(workers, record):
+                    record.done = "YES"
+                    record.error = '=""'
+                    future.set_result(record)
+                else:
+                    rendered.append((record, future))
+            except Exception as e:
+                print(f"\u274C Error on record {record.number}:", e)
+                future.set_result(scrap_record(workers, record))
 
-                                success = True
+        if not rendered:
+            return
 
-                            except Exception as e:
-                                error_number += 1
+        acquired: Browser = workers.browsers.acquire()
+        browser: Browser | None = acquired
+        pages: int = 0
 
-                                attempts += 1
+        try:
+            tabs: int = max(acquired.tab_pool_size, 1)
 
-                                done = "NO"
-                                error = str(e)
+            for index, (record, _) in enumerate(rendered[:tabs]):
+                acquired.go_to_pooled_tab(index + 1)
+                acquired.load_url(record.url)
 
-                                print("❌ Error:", e)
-                            finally:
-                                sheet[f"A{row}"] = done
-                                sheet[f"B{row}"] = page
-                                sheet[f"C{row}"] = record_number
-                                sheet[f"D{row}"] = text
-                                sheet[f"E{row}"] = images
-                                sheet[f"F{row}"] = videos
-                                sheet[f"G{row}"] = links
-                                sheet[f"H{row}"] = company
-                                sheet[f"I{row}"] = address
-                                sheet[f"J{row}"] = website
-                                sheet[f"K{row}"] = logo
-                                sheet[f"L{row}"] = url
-                                sheet[f"M{row}"] = error
+            for index, (record, future) in enumerate(rendered):
+                if browser is None:
+                    future.set_result(scrap_record(workers, record))
+                    continue
 
-                                excel.save_book()
-                                Files.copy_file(
-                                    f"{file_name}.xlsx",
-                                    f"{file_name}_copy.xlsx",
-                                )
+                print(f"< Record {record.number} | Attempt {record.failures + 1} >")
 
-                    timer.stop_timer()
+                browser.go_to_pooled_tab(index % tabs + 1)
+                pages += 1
 
-                    print(f"Seconds: {timer.get_elapsed_time():.2f}")
+                try:
+                    render_record(workers, browser, record, loading=True)
+                    record.done = "YES"
+                    record.error = '=""'
+                except Exception as e:
+                    record.failures += 1
+                    record.done = "NO"
+                    record.error = str(e)
+                    print(f"\u274C Error on record {record.number}:", e)
 
-        if page_end > page:
-            page = go_to_page(browser) or 1
+                    if browser.is_alive():
+                        scrap_record(workers, record, browser)
+                    else:
+                        # The remaining records are scrapped one by one with the browser that replaces it
+                        workers.browsers.release(browser, pages)
+                        browser = None
+                        scrap_record(workers, record)
+
+                if browser is not None and index + tabs < len(rendered):
+                    browser.load_url(rendered[index + tabs][0].url)
+
+                future.set_result(record)
+        finally:
+            if browser is not None:
+                workers.browsers.release(browser, pages)
+    except Exception as e:
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+
+
+def go_to_page(browser: Browser, page: int = 0) -> int | None:
+    """
+    Click the next page button of the exhibitor list, or go to a given page, with up to three attempts.
+
+    Args:
+        browser (Browser): browser with the exhibitor list
+        page (int): page to go to. The next page by default
+    Returns:
+        int | None; page number of the button clicked
+    """
+    success: bool = False
+    attempts: int = 0
+
+    while not success and attempts < 3:
+        button_number: int = 0
+
+        try:
+            browser.wait_css_clickable(".layui-laypage-next")
+
+            next_button: WebElement | None = browser.find_one_by_css(".layui-laypage-next")
+
+            if next_button:
+                if page > 0:
+                    browser.set_attribute(next_button, "data-page", str(page))
+                button_number = int(next_button.get_attribute("data-page") or "0")
+                print(f"Going to page {button_number}")
+                browser.click_element(next_button)
+                success = True
+        except Exception as e:
+            attempts += 1
+            print(f"Error going to page: {e}")
+            browser.wait_ready(".layui-laypage-next", timeout=5, idle=0.5)
+
+    if success:
+        return button_number
+    else:
+        raise Exception(f"It was not possible to go to the page {page}")
+
+
+def save_checkpoints(checkpoint: Checkpoint, records: List[dict[str, Any]]) -> None:
+    """
+    Mark the records persisted by a sink as done or failed in the checkpoint.
+
+    Args:
+        checkpoint (Checkpoint): checkpoint of the exhibitor list
+        records (List[dict[str, Any]]): records just persisted
+    """
+    checkpoint.update(
+        (
+            record["url"],
+            Checkpoint.DONE if record["done"] == "YES" else Checkpoint.FAILED,
+            record["attempts"],
+            "" if record["done"] == "YES" else record["error"],
+        )
+        for record in records
+    )
 
-            if page % 100 == 0:
-                sheet_number = get_sheet_number(page)
-                sheet = get_sheet(excel, str(sheet_number))
-                row = get_row(record_number, sheet_number)
-        else:
-            break
 
-    if error_number:
-        print("Execution stopped due to errors")
+def scrap(page_start: int = 1, page_end: int = 737, workers: int = 4, render: bool = True, cache_pages: bool = True) -> None:
+    """
+    Scrap the exhibitor list pages and the detail page of every exhibitor without translating them, then export the records to Excel. Translate them later with translate.
 
-    excel.close()
-    browser.quit()
+    Args:
+        page_start (int): first list page. 1 by default
+        page_end (int): last list page. 737 by default
+        workers (int): threads with their own browser for detail pages. 4 by default
+        render (bool): render every detail page with the browser. True by default
+        cache_pages (bool): keep rendered detail pages in the response cache for reparse. Otherwise the fields are extracted inside the browser and the page source code is never transferred. True by default
+    """
+    run(page_start, page_end, workers, 0, render, cache_pages=cache_pages)
 
 
 # def separate_content() -> None:
@@ -372,10 +559,97 @@ def scrap(page_start: int = 1, page_end: int = 737) -> None:
 #     return Content(text, images, videos, links)
 
 
-def translate() -> None:
+def reparse_record(record: Record, path: str) -> Record:
+    """
+    Extract the record fields again from a cached detail page.
+
+    Args:
+        record (Record): record to fill
+        path (str): cache blob path of the detail page
+    Returns:
+        Record
+    """
+    try:
+        extract_company(ResponseCache.read_blob(path), record)
+        record.done = "YES"
+    except Exception as e:
+        record.failures = 1
+        record.done = "NO"
+        record.error = str(e)
+
+    return record
+
+
+def reparse(processes: int | None = None) -> None:
+    """
+    Rebuild the results from the cached detail pages without browser nor network, using a process per core.
+
+    Args:
+        processes (int | None): number of processes. One per core by default
+    """
+    print(file_name)
+
+    cache: ResponseCache = ResponseCache(f"{file_name}_cache")
+    entries: List[tuple[str, str]] = list(cache.entries())
+    cache.close()
+
+    print(f"Reparsing {len(entries)} cached pages")
+
+    previous: dict[str, dict[str, Any]] = {record["url"]: record for record in JsonLinesSink(file_name, columns, "url").read()}
+    records: List[Record] = []
+
+    for url, _ in entries:
+        values: dict[str, Any] = previous.get(url, {})
+        records.append(Record(values.get("page", 0), values.get("number", 0), url))
+
+    sink: Sink = JsonLinesSink(f"{file_name}_reparsed", columns, "url", batch_size=500)
+    sink.clear()
+
+    timer: Timer = Timer()
+    timer.start_timer()
+
+    errors: int = 0
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for record in executor.map(reparse_record, records, [path for _, path in entries], chunksize=32):
+            errors += record.failures
+            sink.write(record.to_dict())
+
+    timer.stop_timer()
+
+    print(f"Reparsed {len(records)} pages with {errors} errors in {timer.get_elapsed_time():.2f} seconds")
+
+    sink.export(f"{file_name}_reparsed", lambda record: str(get_sheet_number(record["page"])), "number")
+    sink.close()
 
-    excel: Excel = Excel(file_name)
-    Files.copy_file(f"{file_name}.xlsx", f"{file_name}_backup.xlsx")
+
+def translate_rows(translator: Translator, rows: List[dict[str, Any]]) -> None:
+    """
+    Translate the text and company of the rows in a single batch, filling their translated, text_es and company_es columns.
+
+    Args:
+        translator (Translator): translator from Chinese to Spanish
+        rows (List[dict[str, Any]]): rows with text and company columns
+    """
+    translations: List[str] = translator.translate_batch([str(row["text"] or "") for row in rows] + [str(row["company"] or "") for row in rows])
+
+    for row, text_es, company_es in zip(rows, translations[: len(rows)], translations[len(rows) :]):
+        row["translated"] = "YES"
+        row["text_es"] = text_es
+        row["company_es"] = company_es
+
+    print(f"{len(rows)} rows translated")
+
+
+def translate(batch_size: int = 50) -> None:
+
+    def write_rows(rows: List[dict[str, Any]]) -> None:
+        translate_rows(translator, rows)
+
+        for row in rows:
+            sink.write(row)
+
+    excel: Excel = Excel(file_name, read_only=True)
 
     print(file_name)
     print(
@@ -383,43 +657,198 @@ def translate() -> None:
           excel.sheets[0].title} to {excel.sheets[-1].title}"
     )
 
-    translator: Translator = Translator("zh-CN", "es")
+    memory: TranslationMemory = TranslationMemory(f"{file_name}_translations")
+    translator: Translator = Translator("zh-CN", "es", memory=memory)
+
+    sink: Sink = JsonLinesSink(f"{file_name}_translated", translated_columns, "url")
+    translated: set[str] = {record["url"] for record in sink.read() if record["translated"] == "YES"}
+    pending: List[dict[str, Any]] = []
 
     for sheet in excel.sheets:
 
         print(f"{'=' * 5} Sheet {sheet.title} {'=' * 5}")
 
-        sheet["N1"] = "translated"
-        sheet["O1"] = "text_es"
-        sheet["P1"] = "company_es"
-
         timer: Timer = Timer()
+        timer.start_timer()
+
+        for row, values in enumerate(excel.iter_rows(sheet.title, min_row=2), start=2):
 
-        for row in range(2, sheet.max_row + 1):
+            record: dict[str, Any] = dict(zip(translated_columns, values))
 
-            timer.start_timer()
+            if not record.get("url"):
+                print(f"Row {row}: empty row")
+            elif record["url"] in translated or record.get("translated") == "YES":
+                print(f"Row {row}: already translated")
+            else:
+                pending.append(record)
 
-            Files.copy_file(f"{file_name}.xlsx", f"{file_name}_copy.xlsx")
+                if len(pending) == batch_size:
+                    write_rows(pending)
+                    pending = []
 
-            print(f"{'_' * 3} Row {row} {'_' * 3}")
+        timer.stop_timer()
 
-            is_translated: bool = sheet[f"N{row}"].value == "YES"
+        print(f"Seconds on sheet {sheet.title}: {timer.get_elapsed_time():.2f}")
 
-            if is_translated:
-                print("Already translated")
-            else:
-                translated = "YES"
-                text_translated: str = translator.translate(sheet[f"D{row}"].value)
-                company_translated: str = translator.translate(sheet[f"H{row}"].value)
+    if pending:
+        write_rows(pending)
 
-                sheet[f"N{row}"] = translated
-                sheet[f"O{row}"] = text_translated
-                sheet[f"P{row}"] = company_translated
+    excel.close()
+    memory.close()
 
-                excel.save_book()
+    sink.export(f"{file_name}_translated", lambda record: str(get_sheet_number(record["page"])), "number")
+    sink.close()
 
-            timer.stop_timer()
 
-            print(f"Seconds: {timer.get_elapsed_time():.2f}")
+def list_records(browser: Browser, checkpoint: Checkpoint, page_start: int, page_end: int) -> Iterator[Record]:
+    """
+    Go through the exhibitor list pages and return a record for every exhibitor not browsed yet. Pages are read only as fast as the records are taken.
 
-    excel.close()
+    Args:
+        browser (Browser): browser with the exhibitor list
+        checkpoint (Checkpoint): checkpoint of the exhibitor list
+        page_start (int): first list page
+        page_end (int): last list page
+    Returns:
+        Iterator[Record]
+    """
+    page: int = go_to_page(browser, page_start) or 1
+
+    record_number: int = (page - 1) * 12
+
+    while True:
+        print(f"{'_' * 5} Page {page} {'_' * 5}")
+
+        browser.wait_ready([".exc-item.clearfix", ".exc-item-title.inner"], idle=0.5)
+
+        scrapper: Scrapper = Scrapper(browser.get_page_source_code(), parser, "div.exl-r")
+
+        items_parent: Tag | None = scrapper.find_one("div", "exl-r")
+
+        if items_parent:
+            for url in scrapper.extract(items_schema, items_parent)["urls"]:
+                record_number += 1
+
+                if checkpoint.is_done(url):
+                    print(f"Record {record_number} already browsed")
+                else:
+                    yield Record(page, record_number, url)
+
+        if page_end > page:
+            page = go_to_page(browser) or 1
+        else:
+            break
+
+
+def scrap_batch(workers: Workers, records: List[Record]) -> List[Record]:
+    """
+    Scrap a batch of records on the current thread with scrap_records, so the ones that need rendering go through the warm tabs of a browser from the pool.
+
+    Args:
+        workers (Workers): pool that owns the cache, the HTTP fetcher of the current thread and the browsers
+        records (List[Record]): records with detail page url
+    Returns:
+        List[Record]; every record of the batch, marked as not done if it could not be scrapped
+    """
+    futures: List[Future[Record]] = [Future() for _ in records]
+
+    scrap_records(workers, records, futures)
+
+    for record, future in zip(records, futures):
+        exception: BaseException | None = future.exception() if future.done() else None
+
+        if not future.done() or exception is not None:
+            record.done = "NO"
+            record.error = str(exception)
+
+    return records
+
+
+def translate_records(translator: Translator, records: List[Record]) -> List[dict[str, Any]]:
+    """
+    Translate the text and company of the scrapped records in a single batch.
+
+    Args:
+        translator (Translator): translator from Chinese to Spanish
+        records (List[Record]): records to translate
+    Returns:
+        List[dict[str, Any]]; rows with translated, text_es and company_es columns. Records not scrapped or not translated are kept with translated NO
+    """
+    rows: List[dict[str, Any]] = [{**record.to_dict(), "translated": "NO", "text_es": "", "company_es": ""} for record in records]
+    done: List[dict[str, Any]] = [row for row in rows if row["done"] == "YES"]
+
+    if done:
+        try:
+            translate_rows(translator, done)
+        except Exception as e:
+            # Rows are written anyway; translate picks them up later
+            print(f"\u274C Error translating {len(done)} rows:", e)
+
+    return rows
+
+
+def run(page_start: int = 1, page_end: int = 737, workers: int = 4, translators: int = 2, render: bool = True, batch_size: int = 50, cache_pages: bool = True) -> None:
+    """
+    Scrap, parse, translate and store the exhibitors as a pipeline, so detail pages are translated while the next ones are browsed, then export the records to Excel.
+
+    Args:
+        page_start (int): first list page. 1 by default
+        page_end (int): last list page. 737 by default
+        workers (int): threads scrapping detail pages, each one with a browser from the pool and its warm tabs. Pages are parsed on the same threads. 4 by default
+        translators (int): threads translating batches of records; 0 to store the records without translating them. 2 by default
+        render (bool): render every detail page with the browser. True by default
+        batch_size (int): records translated at once. 50 by default
+        cache_pages (bool): keep rendered detail pages in the response cache for reparse. Otherwise the fields are extracted inside the browser and the page source code is never transferred. True by default
+    """
+    print(file_name)
+    print(f"Running pages from {page_start} to {page_end} with {workers} workers and {translators} translators")
+
+    checkpoint: Checkpoint = Checkpoint(f"{file_name}_checkpoint")
+    sink: Sink = JsonLinesSink(file_name, translated_columns if translators else columns, "url", batch_size=12, on_flush=lambda records: save_checkpoints(checkpoint, records))
+
+    print(f"Records already browsed: {checkpoint.count(Checkpoint.DONE)}")
+
+    browser: Browser = Browser()
+    browser.go_to_url("https://www.cmef.com.cn/exhibitorlist?type=1", 5)
+
+    cache: ResponseCache | None = ResponseCache(f"{file_name}_cache") if cache_pages else None
+    pool: Workers = Workers(workers, render, cache)
+    memory: TranslationMemory | None = None
+
+    # A list page of records per batch, so every browser keeps its warm tabs loading
+    stages: List[Stage] = [Stage("scrap", lambda records: scrap_batch(pool, records), workers=workers, queue_size=workers * 24, batch_size=12)]
+
+    if translators:
+        memory = TranslationMemory(f"{file_name}_translations")
+        translator: Translator = Translator("zh-CN", "es", memory=memory)
+        stages.append(Stage("translate", lambda records: translate_records(translator, records), workers=translators, queue_size=batch_size * translators, batch_size=batch_size, batch_seconds=30))
+        stages.append(Stage("sink", sink.write, queue_size=batch_size * translators))
+    else:
+        stages.append(Stage("sink", lambda record: sink.write(record.to_dict()), queue_size=workers * 24))
+
+    pipeline: Pipeline = Pipeline(stages)
+
+    timer: Timer = Timer()
+    timer.start_timer()
+
+    try:
+        pipeline.run(list_records(browser, checkpoint, page_start, page_end))
+    finally:
+        pool.shutdown()
+        browser.quit()
+        sink.flush()
+        if memory is not None:
+            memory.close()
+
+    timer.stop_timer()
+
+    print(f"Seconds running: {timer.get_elapsed_time():.2f}")
+
+    if Files.file_exists(f"{file_name}.xlsx"):
+        Files.copy_file(f"{file_name}.xlsx", f"{file_name}_backup.xlsx")
+
+    sink.export(file_name, lambda record: str(get_sheet_number(record["page"])), "number")
+    sink.close()
+    checkpoint.close()
+    if cache is not None:
+        cache.close()
@@ -0,0 +1,148 @@
+import os
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from webscrapper.pipeline import Pipeline, Stage
+from webscrapper.scrapper import Scrapper, Tag
+from webscrapper.translator import LocalBackend, Translator
+
+fixtures_folder: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(name: str) -> str:
+    with open(file=os.path.join(fixtures_folder, name), mode="r", encoding="utf8") as file:
+        return file.read()
+
+
+def measure(function: Callable[[], object], number: int = 50) -> float:
+    """
+    Return the best time in milliseconds of running function, out of five rounds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1000
+
+
+def benchmark_parsers() -> None:
+    source_code: str = read_fixture("company-detail.html")
+
+    print(f"{'=' * 5} Parse time per detail page ({len(source_code) / 1024:.1f} KiB) {'=' * 5}")
+
+    for parser in Scrapper.PARSERS:
+        print(f"{parser:>12}: {measure(lambda: Scrapper(source_code, parser)):.2f} ms")
+
+    print(f"{'=' * 5} Parse time of div.company-detail only {'=' * 5}")
+
+    for parser in Scrapper.PARSERS[:2]:
+        whole: float = measure_memory(lambda: Scrapper(source_code, parser))
+        partial: float = measure_memory(lambda: Scrapper(source_code, parser, "div.company-detail"))
+        print(f"{parser:>12}: {measure(lambda: Scrapper(source_code, parser, 'div.company-detail')):.2f} ms, {partial:.1f} KiB of {whole:.1f} KiB")
+
+
+def measure_memory(function: Callable[[], object]) -> float:
+    """
+    Return the memory in KiB allocated while running function once.
+    """
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def benchmark_set_root() -> None:
+    source_code: str = read_fixture("company-detail.html")
+    scrapper: Scrapper = Scrapper(source_code)
+    company_detail: Tag | None = scrapper.find_one("div", "company-detail")
+
+    if not company_detail:
+        raise Exception("Company detail not found in fixture")
+
+    def reparse_root() -> None:
+        Scrapper(str(company_detail)).find_one("div", "section")
+
+    def scope_root() -> None:
+        scrapper.set_root(company_detail)
+        scrapper.find_one("div", "section")
+
+    print(f"{'=' * 5} Scoping to div.company-detail {'=' * 5}")
+    print(f"{'reparse':>12}: {measure(reparse_root):.3f} ms, {measure_memory(reparse_root):.1f} KiB")
+    print(f"{'set_root':>12}: {measure(scope_root):.3f} ms, {measure_memory(scope_root):.1f} KiB")
+
+
+def benchmark_get_content() -> None:
+    scrapper: Scrapper = Scrapper(read_fixture("company-detail.html"), "lxml")
+    content_element: Tag | None = scrapper.find_one("div", "comp-detail")
+
+    if not content_element:
+        raise Exception("Content not found in fixture")
+
+    print(f"{'=' * 5} Content of div.comp-detail {'=' * 5}")
+    print(f"{'get_content':>12}: {measure(lambda: scrapper.get_content(content_element), number=200):.3f} ms")
+
+
+def benchmark_schema() -> None:
+    from pages.exhibitorlist import company_schema
+
+    scrapper: Scrapper = Scrapper(read_fixture("company-detail.html"), "lxml", "div.company-detail")
+
+    def find_fields() -> None:
+        for field in company_schema.fields.values():
+            scrapper.find_one("div", "company-detail").select_one(field.selector)  # type: ignore
+
+    def select_fields() -> None:
+        for field in company_schema.fields.values():
+            scrapper.select_one(field.selector)
+
+    print(f"{'=' * 5} Company fields of div.company-detail {'=' * 5}")
+    print(f"{'Tag.select':>12}: {measure(find_fields, number=200):.3f} ms")
+    print(f"{'compiled':>12}: {measure(select_fields, number=200):.3f} ms")
+    print(f"{'schema':>12}: {measure(lambda: scrapper.extract(company_schema), number=200):.3f} ms")
+
+
+def benchmark_translate_batch() -> None:
+    rows: int = 500
+    texts: list[str] = [f"公司简介 {index % 200}" for index in range(rows)] + [f"公司 {index}" for index in range(rows)]
+    backend: LocalBackend = LocalBackend(latency=0.05)
+    translator: Translator = Translator("zh-CN", "es", backend=backend)
+
+    print(f"{'=' * 5} Translation of {rows} rows with 50 ms per request {'=' * 5}")
+
+    start: float = timeit.default_timer()
+    translator.translate_batch(texts)
+    print(f"{'batch':>12}: {(timeit.default_timer() - start) * 1000:.0f} ms, {backend.requests} requests (one per text: {len(texts) * 50} ms)")
+
+
+def benchmark_pipeline() -> None:
+    records: int = 200
+    backend: LocalBackend = LocalBackend(latency=0.05)
+    translator: Translator = Translator("zh-CN", "es", backend=backend)
+
+    def fetch(number: int) -> str:
+        time.sleep(0.02)
+        return f"公司 {number}"
+
+    print(f"{'=' * 5} {records} records fetched in 20 ms by 4 workers and translated in batches of 50 {'=' * 5}")
+
+    start: float = timeit.default_timer()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        texts: list[str] = list(executor.map(fetch, range(records)))
+    for index in range(0, records, 50):
+        translator.translate_batch(texts[index : index + 50])
+    print(f"{'sequential':>12}: {(timeit.default_timer() - start) * 1000:.0f} ms")
+
+    pipeline: Pipeline = Pipeline([Stage("fetch", fetch, workers=4), Stage("translate", translator.translate_batch, workers=2, batch_size=50), Stage("sink", lambda text: None)])
+
+    start = timeit.default_timer()
+    pipeline.run(range(records))
+    print(f"{'pipeline':>12}: {(timeit.default_timer() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_parsers()
+    benchmark_set_root()
+    benchmark_get_content()
+    benchmark_schema()
+    benchmark_translate_batch()
+    benchmark_pipeline()
@@ -3,7 +3,8 @@ from typing import List
 import unittest
 from unittest import TestCase
 
-from webscrapper.browser import Browser, WebElement
+from webscrapper.browser import Browser, BrowserPool, WebElement
+from webscrapper.scrapper import Field, Schema
 from webscrapper.utils import Files
 
 
@@ -257,3 +258,99 @@ class BrowserTest(TestCase):
         self.assertEqual(link_text, "Google", "Element has not been found by xpath")
 
         self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_wait_ready(self) -> None:
+        link: str = "https://doodles.google/"
+
+        self.browser.go_to_url(link)
+
+        self.assertTrue(self.browser.wait_ready([".glue-carousel__list", ".doodle-card"], idle=0.5))
+        self.assertFalse(self.browser.wait_ready(".missing-selector", timeout=1))
+
+        self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_wait_all_present(self) -> None:
+        link: str = "https://doodles.google/"
+
+        self.browser.go_to_url(link)
+
+        present: List[str] = self.browser.wait_all_present([".glue-carousel__list", ".doodle-card", ".missing-selector"], timeout=2)
+
+        self.assertEqual(present, [".glue-carousel__list", ".doodle-card"])
+
+        self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_extract(self) -> None:
+        self.browser.go_to_url("data:text/html,<main><h1 class='title'> Title </h1><a href='/a'>A</a><a href='/b'>B</a><p><em>text</em></p></main>")
+
+        schema: Schema = Schema(
+            {
+                "title": Field("h1.title", required=True, process=str.strip),
+                "links": Field("a", attribute="href", many=True),
+                "paragraph": Field("p", tag=True),
+                "missing": Field("table", default=""),
+            }
+        )
+
+        values: dict = self.browser.extract(schema, "main")
+
+        self.assertEqual(values["title"], "Title")
+        self.assertEqual(values["links"], ["/a", "/b"])
+        self.assertEqual(values["paragraph"].em.text, "text")
+        self.assertEqual(values["missing"], "")
+
+        self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_block_resources(self) -> None:
+        self.browser.quit()
+        self.browser = Browser(block_resources=True)
+
+        self.browser.go_to_url("data:text/html,<link rel='stylesheet' href='https://example.com/style.css' onerror=\"document.title='blocked'\">")
+
+        self.assertTrue(self.browser.wait_ready(timeout=5, idle=0.5))
+        self.assertEqual(self.browser.get_page_title(), "blocked")
+
+        self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_tab_pool(self) -> None:
+        self.browser.open_tab_pool(3)
+
+        self.assertEqual(self.browser.tab_pool_size, 3)
+
+        for index in range(1, 4):
+            self.browser.go_to_pooled_tab(index)
+            self.browser.load_url(f"data:text/html,<title>{index}</title><p class='tab'>{index}</p>")
+
+        for index in range(1, 4):
+            self.browser.go_to_pooled_tab(index)
+            self.assertEqual(self.browser.wait_all_present([".tab"]), [".tab"])
+            self.assertEqual(self.browser.get_page_title(), str(index))
+
+        self.browser.quit()
+
+    @unittest.skip("Requires Chrome for Testing")
+    def test_browser_pool(self) -> None:
+        self.browser.quit()
+
+        pool: BrowserPool = BrowserPool(2, max_pages=2)
+
+        browser: Browser = pool.acquire()
+        self.assertTrue(browser.is_alive())
+        self.assertGreater(browser.get_memory(), 0)
+
+        pool.release(browser, 2)
+        self.assertFalse(browser.is_alive())
+
+        crashed: Browser = pool.acquire()
+        crashed.quit()
+        pool.release(crashed)
+
+        self.assertTrue(pool.acquire().is_alive())
+        self.assertEqual(len(pool), 1)
+
+        pool.close()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from webscrapper.cache import ResponseCache
+from webscrapper.fetcher import HttpFetcher
+from webscrapper.utils import Files
+
+
+class CacheTest(unittest.TestCase):
+
+    class __Handler(BaseHTTPRequestHandler):
+
+        downloads: int = 0
+
+        def do_GET(self) -> None:
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            type(self).downloads += 1
+            body: bytes = b"<html><body>page</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    def setUp(self) -> None:
+        self.cache: ResponseCache = ResponseCache("test-cache", max_bytes=1024)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        shutil.rmtree(Files.create_path_outside("test-cache"), ignore_errors=True)
+        return super().tearDown()
+
+    def test_put_and_get(self) -> None:
+        self.assertIsNone(self.cache.get("https://a"))
+
+        self.cache.put("https://a", "<p>公司</p>")
+        self.cache.put("https://b", "<p>公司</p>")
+
+        self.assertEqual(self.cache.get("https://a"), "<p>公司</p>")
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(len({path for _, path in self.cache.entries()}), 1)
+
+    def test_eviction(self) -> None:
+        for number in range(20):
+            self.cache.put(f"https://{number}", os.urandom(100).hex())
+
+        self.assertLessEqual(self.cache.size, 1024)
+        self.assertIsNone(self.cache.get("https://0"))
+        self.assertIsNotNone(self.cache.get("https://19"))
+
+    def test_revalidation(self) -> None:
+        server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), CacheTest.__Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url: str = f"http://127.0.0.1:{server.server_address[1]}/page"
+        fetcher: HttpFetcher = HttpFetcher(retries=0, cache=self.cache)
+
+        first: str = fetcher.get_page_source_code(url)
+        second: str = fetcher.get_page_source_code(url)
+
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(CacheTest.__Handler.downloads, 1)
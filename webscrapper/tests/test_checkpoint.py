@@ -0,0 +1,45 @@
+import os
+import unittest
+
+from webscrapper.checkpoint import Checkpoint, Entry
+from webscrapper.utils import Files
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.checkpoint: Checkpoint = Checkpoint("test-checkpoint")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.checkpoint.close()
+        for name in ["test-checkpoint.sqlite", "test-checkpoint.sqlite-wal", "test-checkpoint.sqlite-shm"]:
+            path: str = Files.create_path_outside(name)
+            if os.path.exists(path):
+                os.remove(path)
+        return super().tearDown()
+
+    def test_mark_failed_and_done(self) -> None:
+        url: str = "https://www.cmef.com.cn/company/1"
+
+        self.assertIsNone(self.checkpoint.get(url))
+        self.assertFalse(self.checkpoint.is_done(url))
+
+        self.checkpoint.mark_failed(url, "Content not found", 3)
+        self.assertFalse(self.checkpoint.is_done(url))
+        self.assertEqual(self.checkpoint.count(Checkpoint.FAILED), 1)
+
+        self.checkpoint.mark_done(url)
+        entry: Entry | None = self.checkpoint.get(url)
+
+        self.assertTrue(self.checkpoint.is_done(url))
+        self.assertIsNotNone(entry)
+        if entry:
+            self.assertEqual(entry.attempts, 4)
+            self.assertEqual(entry.error, "")
+
+    def test_update(self) -> None:
+        self.checkpoint.update((f"url-{number}", Checkpoint.DONE, 1, "") for number in range(100))
+
+        self.assertEqual(self.checkpoint.count(Checkpoint.DONE), 100)
+        self.assertTrue(self.checkpoint.is_done("url-42"))
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from webscrapper.engine import FetchEngine, TokenBucket
+from webscrapper.fetcher import HttpFetcher
+
+
+class BrokenFetcher(HttpFetcher):
+
+    def get_page_source_code(self, url: str) -> str:
+        if url.endswith("/broken"):
+            raise RuntimeError("Broken page")
+        return super().get_page_source_code(url)
+
+
+class EngineTest(unittest.TestCase):
+
+    class __Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self) -> None:
+            if self.path.startswith("/missing"):
+                self.send_error(404)
+                return
+
+            time.sleep(0.05)
+            body: bytes = f"<html><body>{self.path}</body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    def setUp(self) -> None:
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), EngineTest.__Handler)
+        self.url: str = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        return super().tearDown()
+
+    def test_token_bucket(self) -> None:
+
+        async def take(bucket: TokenBucket, tokens: int) -> float:
+            start: float = time.monotonic()
+            for _ in range(tokens):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        elapsed: float = asyncio.run(take(TokenBucket(20, 5), 15))
+
+        self.assertGreaterEqual(elapsed, 0.45)
+
+    def test_fetch_many(self) -> None:
+        engine: FetchEngine = FetchEngine(concurrency=10, rate=1000, burst=100)
+        urls: list[str] = [f"{self.url}/{index}" for index in range(30)] + [f"{self.url}/missing"]
+
+        async def collect() -> dict[str, str]:
+            return {url: html async for url, html in engine.fetch_many(urls)}
+
+        start: float = time.monotonic()
+        pages: dict[str, str] = asyncio.run(collect())
+        elapsed: float = time.monotonic() - start
+        engine.close()
+
+        self.assertEqual(len(pages), 30)
+        self.assertIn(f"/{7}<", pages[f"{self.url}/7"])
+        self.assertIn(f"{self.url}/missing", engine.failures)
+        self.assertLess(elapsed, 30 * 0.05)
+
+    def test_cancel(self) -> None:
+        engine: FetchEngine = FetchEngine(concurrency=2, rate=1000, burst=100)
+        urls: list[str] = [f"{self.url}/{index}" for index in range(50)]
+
+        async def collect() -> int:
+            count: int = 0
+            async for _ in engine.fetch_many(urls):
+                count += 1
+                if count == 3:
+                    engine.cancel()
+            return count
+
+        count: int = asyncio.run(collect())
+        engine.close()
+
+        self.assertLess(count, 10)
+
+    def test_fetch_many_twice(self) -> None:
+        engine: FetchEngine = FetchEngine(concurrency=5, rate=200, burst=1)
+        urls: list[str] = [f"{self.url}/{index}" for index in range(10)]
+
+        async def collect() -> dict[str, str]:
+            return {url: html async for url, html in engine.fetch_many(urls)}
+
+        first: dict[str, str] = asyncio.run(collect())
+        second: dict[str, str] = asyncio.run(collect())
+        engine.close()
+
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(second), 10)
+        self.assertEqual(engine.failures, {})
+
+    def test_fetch_many_unexpected_error(self) -> None:
+        engine: FetchEngine = FetchEngine(concurrency=2, rate=1000, burst=100, fetcher=BrokenFetcher())
+        urls: list[str] = [f"{self.url}/{index}" for index in range(9)] + [f"{self.url}/broken"]
+
+        async def collect() -> dict[str, str]:
+            return {url: html async for url, html in engine.fetch_many(urls)}
+
+        pages: dict[str, str] = asyncio.run(collect())
+        engine.close()
+
+        self.assertEqual(len(pages), 9)
+        self.assertIsInstance(engine.failures[f"{self.url}/broken"], RuntimeError)
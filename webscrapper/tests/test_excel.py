@@ -0,0 +1,33 @@
+import os
+import unittest
+
+from webscrapper.excel import Excel
+from webscrapper.utils import Files
+
+
+class ExcelTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        path: str = Files.create_path_outside("test-book.xlsx")
+        if os.path.exists(path):
+            os.remove(path)
+        return super().tearDown()
+
+    def test_write_only_and_read_only(self) -> None:
+        writer: Excel = Excel("test-book", write_only=True)
+        writer.create_sheet("0")
+        writer.append_rows("0", [("number", "text")])
+        writer.append_rows("0", ((number, f"text {number}") for number in range(1, 1001)))
+
+        with self.assertRaises(ValueError):
+            writer.iter_rows("0")
+
+        writer.save_book()
+        writer.close()
+
+        reader: Excel = Excel("test-book", read_only=True)
+        rows: list[tuple] = list(reader.iter_rows("0", min_row=2))
+        reader.close()
+
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(rows[-1], (1000, "text 1000"))
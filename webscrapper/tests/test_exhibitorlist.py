@@ -0,0 +1,282 @@
+import glob
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import Future
+from typing import Any, Iterator, List
+from unittest import mock
+
+from pages import exhibitorlist
+from pages.exhibitorlist import Record, Workers
+from webscrapper.browser import Browser, BrowserPool
+from webscrapper.cache import ResponseCache
+from webscrapper.checkpoint import Checkpoint
+from webscrapper.memory import TranslationMemory
+from webscrapper.scrapper import Schema, Scrapper
+from webscrapper.sink import JsonLinesSink
+from webscrapper.translator import LocalBackend, Translator
+from webscrapper.utils import Files
+
+fixtures_folder: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+with open(file=os.path.join(fixtures_folder, "company-detail.html"), mode="r", encoding="utf8") as fixture:
+    company_detail: str = fixture.read()
+
+
+def remove_outputs() -> None:
+    """Delete every file and folder created by the tests at package parent folder."""
+    for path in glob.glob(Files.create_path_outside("test-exhibitorlist*")):
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+class FakeBrowser(Browser):
+    """Browser without driver whose detail pages are the company detail fixture."""
+
+    def __init__(self, tabs: int = 3, crash: str = "") -> None:
+        self.tabs: int = tabs
+        self.crash: str = crash
+        self.alive: bool = True
+        self.tab: int = 1
+        self.urls: dict[int, str] = {}
+        self.loaded: List[str] = []
+        self.visited: List[str] = []
+
+    @property
+    def tab_pool_size(self) -> int:
+        return self.tabs
+
+    def go_to_pooled_tab(self, index: int) -> None:
+        self.tab = index
+
+    def load_url(self, url: str) -> None:
+        self.loaded.append(url)
+        self.urls[self.tab] = url
+
+    def go_to_url(self, url: str = "about:blank", seconds: int = 0) -> None:
+        self.visited.append(url)
+        self.urls[self.tab] = url
+
+    def wait_all_present(self, selectors: List[str], timeout: float = 10, poll: float = 0.1) -> List[str]:
+        if self.urls.get(self.tab) == self.crash:
+            self.alive = False
+            raise Exception("Browser crashed")
+        return selectors
+
+    def delete_scripts(self) -> None:
+        pass
+
+    def get_page_source_code(self) -> str:
+        return company_detail
+
+    def extract(self, schema: Schema, root: str | None = None) -> dict[str, Any]:
+        return Scrapper(company_detail, "lxml", root).extract(schema)
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def quit(self) -> None:
+        pass
+
+
+class FakeBrowserPool(BrowserPool):
+    """Pool handing out the given fake browsers in order, reusing the ones released alive."""
+
+    def __init__(self, browsers: List[FakeBrowser]) -> None:
+        super().__init__(len(browsers))
+        self.browsers: List[FakeBrowser] = browsers
+        self.released: List[tuple[Browser, int]] = []
+
+    def acquire(self) -> Browser:
+        return self.browsers.pop(0)
+
+    def release(self, browser: Browser, pages: int = 1) -> None:
+        self.released.append((browser, pages))
+
+        if isinstance(browser, FakeBrowser) and browser.alive:
+            self.browsers.insert(0, browser)
+
+
+class FakeWorkers(Workers):
+    """Workers whose browsers come from a fake pool."""
+
+    def __init__(self, pool: FakeBrowserPool, render: bool = True, cache: ResponseCache | None = None) -> None:
+        super().__init__(1, render, cache)
+        self.pool: FakeBrowserPool = pool
+
+    @property
+    def browsers(self) -> BrowserPool:
+        return self.pool
+
+
+class ExhibitorListTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.records: List[Record] = [Record(1, number, f"https://www.cmef.com.cn/detail/{number}") for number in range(1, 6)]
+        return super().setUp()
+
+    def scrap(self, workers: Workers) -> List[Record]:
+        futures: List[Future[Record]] = [Future() for _ in self.records]
+        exhibitorlist.scrap_records(workers, self.records, futures)
+        return [future.result(timeout=0) for future in futures]
+
+    def test_scrap_records_warm_tabs(self) -> None:
+        browser: FakeBrowser = FakeBrowser()
+        pool: FakeBrowserPool = FakeBrowserPool([browser])
+
+        records: List[Record] = self.scrap(FakeWorkers(pool))
+
+        self.assertEqual([record.done for record in records], ["YES"] * 5)
+        self.assertEqual(records[0].company, "深圳迈瑞生物医疗电子股份有限公司")
+        self.assertEqual(browser.loaded, [record.url for record in self.records])
+        self.assertEqual(browser.visited, [])
+        self.assertEqual(pool.released, [(browser, 5)])
+
+    def test_scrap_records_dead_browser(self) -> None:
+        crashed: FakeBrowser = FakeBrowser(crash=self.records[1].url)
+        replacement: FakeBrowser = FakeBrowser()
+        pool: FakeBrowserPool = FakeBrowserPool([crashed, replacement])
+
+        records: List[Record] = self.scrap(FakeWorkers(pool))
+
+        self.assertEqual([record.done for record in records], ["YES"] * 5)
+        self.assertEqual(records[1].failures, 1)
+        self.assertEqual(crashed.loaded, [record.url for record in self.records[:4]])
+        # The record that crashed the browser and the remaining ones are scrapped one by one with the replacement
+        self.assertEqual(replacement.visited, [record.url for record in self.records[1:]])
+        self.assertEqual(pool.released[0], (crashed, 2))
+
+
+class ReparseTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.folder: str = tempfile.mkdtemp()
+        self.file_name: str = exhibitorlist.file_name
+        exhibitorlist.file_name = "test-exhibitorlist"
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        exhibitorlist.file_name = self.file_name
+        shutil.rmtree(self.folder)
+        remove_outputs()
+        return super().tearDown()
+
+    def write_blob(self, name: str, source_code: str) -> str:
+        path: str = os.path.join(self.folder, f"{name}.html.gz")
+        with gzip.open(path, mode="wt", encoding="utf8") as file:
+            file.write(source_code)
+        return path
+
+    def test_reparse_record(self) -> None:
+        record: Record = exhibitorlist.reparse_record(Record(1, 1, "url"), self.write_blob("good", company_detail))
+
+        self.assertEqual(record.done, "YES")
+        self.assertEqual(record.company, "深圳迈瑞生物医疗电子股份有限公司")
+
+        record = exhibitorlist.reparse_record(Record(1, 2, "url"), self.write_blob("bad", "<html><body></body></html>"))
+
+        self.assertEqual(record.done, "NO")
+        self.assertEqual(record.failures, 1)
+
+    def test_reparse(self) -> None:
+        cache: ResponseCache = ResponseCache("test-exhibitorlist_cache")
+        cache.put("https://www.cmef.com.cn/detail/1", company_detail)
+        cache.put("https://www.cmef.com.cn/detail/2", "<html><body></body></html>")
+        cache.close()
+
+        previous: JsonLinesSink = JsonLinesSink("test-exhibitorlist", exhibitorlist.columns, "url")
+        previous.write(Record(150, 1790, "https://www.cmef.com.cn/detail/1").to_dict())
+        previous.close()
+
+        exhibitorlist.reparse(processes=2)
+
+        records: dict[str, dict[str, Any]] = {record["url"]: record for record in JsonLinesSink("test-exhibitorlist_reparsed", exhibitorlist.columns, "url").read()}
+
+        self.assertEqual(records["https://www.cmef.com.cn/detail/1"]["done"], "YES")
+        self.assertEqual(records["https://www.cmef.com.cn/detail/1"]["number"], 1790)
+        self.assertEqual(records["https://www.cmef.com.cn/detail/2"]["done"], "NO")
+        self.assertTrue(os.path.exists(Files.create_path_outside("test-exhibitorlist_reparsed.xlsx")))
+
+
+class RunTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.records: List[Record] = [Record(1 + number // 12, number, f"https://www.cmef.com.cn/detail/{number}") for number in range(1, 15)]
+        self.pools: List[FakeBrowserPool] = []
+        self.patches: List[Any] = [
+            mock.patch.object(exhibitorlist, "file_name", "test-exhibitorlist"),
+            mock.patch.object(exhibitorlist, "Browser", FakeBrowser),
+            mock.patch.object(exhibitorlist, "Workers", self.create_workers),
+            mock.patch.object(exhibitorlist, "Translator", self.create_translator),
+            mock.patch.object(exhibitorlist, "list_records", self.list_records),
+        ]
+        for patch in self.patches:
+            patch.start()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        remove_outputs()
+        return super().tearDown()
+
+    def create_workers(self, size: int, render: bool = True, cache: ResponseCache | None = None) -> Workers:
+        pool: FakeBrowserPool = FakeBrowserPool([FakeBrowser() for _ in range(size)])
+        self.pools.append(pool)
+        return FakeWorkers(pool, render, cache)
+
+    def create_translator(self, source: str, target: str, memory: TranslationMemory | None = None) -> Translator:
+        return Translator(source, target, memory=memory, backend=LocalBackend())
+
+    def list_records(self, browser: Browser, checkpoint: Checkpoint, page_start: int, page_end: int) -> Iterator[Record]:
+        return iter(self.records)
+
+    def read_rows(self) -> List[dict[str, Any]]:
+        return list(JsonLinesSink("test-exhibitorlist", exhibitorlist.translated_columns, "url").read())
+
+    def test_scrap_batch(self) -> None:
+        workers: Workers = self.create_workers(1)
+        records: List[Record] = exhibitorlist.scrap_batch(workers, self.records[:3])
+
+        self.assertEqual([record.done for record in records], ["YES"] * 3)
+        self.assertEqual(self.pools[0].released, [(self.pools[0].browsers[0], 3)])
+
+    def test_translate_records(self) -> None:
+        done: Record = Record(1, 1, "url 1", done="YES", text="公司简介", company="公司")
+        rows: List[dict[str, Any]] = exhibitorlist.translate_records(self.create_translator("zh-CN", "es"), [done, Record(1, 2, "url 2")])
+
+        self.assertEqual([row["translated"] for row in rows], ["YES", "NO"])
+        self.assertEqual(rows[0]["text_es"], "[es] 公司简介")
+        self.assertEqual(rows[0]["company_es"], "[es] 公司")
+        self.assertEqual(rows[1]["text_es"], "")
+
+    def test_run(self) -> None:
+        exhibitorlist.run(1, 2, workers=2, translators=2, batch_size=5)
+
+        rows: List[dict[str, Any]] = self.read_rows()
+
+        self.assertEqual(len(rows), 14)
+        self.assertEqual({row["translated"] for row in rows}, {"YES"})
+        self.assertEqual(rows[0]["company_es"], "[es] 深圳迈瑞生物医疗电子股份有限公司")
+        self.assertTrue(os.path.exists(Files.create_path_outside("test-exhibitorlist.xlsx")))
+
+        checkpoint: Checkpoint = Checkpoint("test-exhibitorlist_checkpoint")
+        self.assertEqual(checkpoint.count(Checkpoint.DONE), 14)
+        checkpoint.close()
+
+    def test_scrap(self) -> None:
+        exhibitorlist.scrap(1, 2, workers=1)
+
+        rows: List[dict[str, Any]] = self.read_rows()
+
+        self.assertEqual(len(rows), 14)
+        self.assertEqual({row["done"] for row in rows}, {"YES"})
+        self.assertNotIn("translated", rows[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from webscrapper.fetcher import FetcherException, HttpFetcher
+
+
+class FetcherTest(unittest.TestCase):
+
+    class __Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self) -> None:
+            if self.path == "/page":
+                body: bytes = "<html><body><h2>公司</h2></body></html>".encode("utf-8")
+                content_type: str = "text/html; charset=utf-8"
+            elif self.path == "/data":
+                body = b'{"company": "name"}'
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    def setUp(self) -> None:
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), FetcherTest.__Handler)
+        self.url: str = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.fetcher: HttpFetcher = HttpFetcher(retries=0)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.fetcher.close()
+        self.server.shutdown()
+        self.server.server_close()
+        return super().tearDown()
+
+    def test_get_page_source_code(self) -> None:
+        self.assertIn("<h2>公司</h2>", self.fetcher.get_page_source_code(f"{self.url}/page"))
+
+    def test_get_json(self) -> None:
+        self.assertEqual(self.fetcher.get_json(f"{self.url}/data"), {"company": "name"})
+
+    def test_not_found(self) -> None:
+        with self.assertRaises(FetcherException):
+            self.fetcher.get_page_source_code(f"{self.url}/missing")
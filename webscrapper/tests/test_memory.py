@@ -0,0 +1,40 @@
+import os
+import unittest
+
+from webscrapper.memory import TranslationMemory
+from webscrapper.utils import Files
+
+
+class TranslationMemoryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.memory: TranslationMemory = TranslationMemory("test-translations", max_entries=3)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.memory.close()
+        for name in ["test-translations.sqlite", "test-translations.sqlite-wal", "test-translations.sqlite-shm"]:
+            path: str = Files.create_path_outside(name)
+            if os.path.exists(path):
+                os.remove(path)
+        return super().tearDown()
+
+    def test_get_and_put(self) -> None:
+        self.assertEqual(self.memory.get("zh-CN", "es", ["你好", "再见"]), {})
+
+        self.memory.put("zh-CN", "es", {"你好": "Hola", "再见": "Adiós"})
+
+        self.assertEqual(self.memory.get("zh-CN", "es", ["你好", "再见", "谢谢"]), {"你好": "Hola", "再见": "Adiós"})
+        self.assertEqual(self.memory.get("zh-CN", "en", ["你好"]), {})
+        self.assertEqual(self.memory.hits, 2)
+        self.assertEqual(self.memory.misses, 4)
+
+    def test_evict_least_recently_used(self) -> None:
+        self.memory.put("zh-CN", "es", {"一": "Uno"})
+        self.memory.put("zh-CN", "es", {"二": "Dos"})
+        self.memory.put("zh-CN", "es", {"三": "Tres"})
+        self.memory.get("zh-CN", "es", ["一"])
+        self.memory.put("zh-CN", "es", {"四": "Cuatro"})
+
+        self.assertEqual(len(self.memory), 3)
+        self.assertEqual(self.memory.get("zh-CN", "es", ["一", "二", "三", "四"]), {"一": "Uno", "三": "Tres", "四": "Cuatro"})
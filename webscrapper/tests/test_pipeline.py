@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+from typing import List
+
+from webscrapper.pipeline import Pipeline, Stage
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_run_stages(self) -> None:
+        results: List[int] = []
+
+        def collect(item: int) -> None:
+            results.append(item)
+
+        pipeline: Pipeline = Pipeline(
+            [
+                Stage("double", lambda item: item * 2, workers=3),
+                Stage("odd", lambda item: item if item % 4 else None, workers=2),
+                Stage("collect", collect),
+            ]
+        )
+        pipeline.run(range(100))
+
+        self.assertEqual(sorted(results), [item * 2 for item in range(100) if item * 2 % 4])
+        self.assertEqual([stage.processed for stage in pipeline.stages], [100, 100, 50])
+
+    def test_batch_stage(self) -> None:
+        batches: List[List[int]] = []
+
+        def batch(items: List[int]) -> List[int]:
+            batches.append(items)
+            return items
+
+        def drop(item: int) -> None:
+            pass
+
+        pipeline: Pipeline = Pipeline(
+            [
+                Stage("batch", batch, batch_size=10, batch_seconds=5),
+                Stage("sink", drop),
+            ]
+        )
+        pipeline.run(range(25))
+
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(pipeline.stages[1].processed, 25)
+
+    def test_errors_drop_items(self) -> None:
+        results: List[int] = []
+
+        def check(item: int) -> int:
+            if item == 3:
+                raise ValueError("Item 3")
+            return item
+
+        def collect(item: int) -> None:
+            results.append(item)
+
+        pipeline: Pipeline = Pipeline([Stage("check", check, workers=2), Stage("collect", collect)])
+        pipeline.run(range(5))
+
+        self.assertEqual(sorted(results), [0, 1, 2, 4])
+        self.assertEqual(pipeline.stages[0].errors, 1)
+
+    def test_bounded_queues(self) -> None:
+        taken: List[int] = []
+        lock: threading.Lock = threading.Lock()
+
+        def source():
+            for item in range(20):
+                with lock:
+                    taken.append(item)
+                yield item
+
+        def slow(item: int) -> int:
+            time.sleep(0.01)
+            with lock:
+                # Items taken from the source can only be waiting in two queues of size 2 or being processed
+                self.assertLessEqual(len(taken) - item, 2 + 2 + 3)
+            return item
+
+        pipeline: Pipeline = Pipeline([Stage("fast", lambda item: item, queue_size=2), Stage("slow", slow, queue_size=2)])
+        pipeline.run(source())
+
+        self.assertEqual(pipeline.stages[1].processed, 20)
+        self.assertEqual(pipeline.stages[1].errors, 0)
+
+    def test_overlap_stages(self) -> None:
+
+        def wait(item: int) -> int:
+            time.sleep(0.01)
+            return item
+
+        pipeline: Pipeline = Pipeline([Stage("first", wait), Stage("second", wait)])
+
+        start: float = time.perf_counter()
+        pipeline.run(range(20))
+
+        # Sequential passes would take 0.4 s
+        self.assertLess(time.perf_counter() - start, 0.35)
+
+
+if __name__ == "__main__":
+    unittest.main()
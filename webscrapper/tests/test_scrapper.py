@@ -1,7 +1,7 @@
 from typing import List
 import unittest
 
-from webscrapper.scrapper import Scrapper, Tag, ResultSet, Content
+from webscrapper.scrapper import Scrapper, Tag, ResultSet, Content, Field, Schema, SchemaException, compile_selector
 
 
 class ScrapperTest(unittest.TestCase):
@@ -143,3 +143,88 @@ class ScrapperTest(unittest.TestCase):
             content: Content = self.scrapper.get_content(main)
 
         print(f"\n{content.text}")
+
+    def test_parsers(self) -> None:
+        for parser in Scrapper.PARSERS:
+            scrapper: Scrapper = Scrapper(self.simple_source_code.replace("<body>", "<body><p class='a'>text</p>"), parser)
+            p: Tag | None = scrapper.find_one("p", "a")
+
+            self.assertTrue(p and p.text == "text", f"Parser {scrapper.parser} failed")
+
+        with self.assertRaises(ValueError):
+            Scrapper("", "selectolax")
+
+    def test_set_root_scope(self) -> None:
+        div: Tag | None = self.scrapper.find_one("div", "container")
+
+        if not div:
+            self.fail("Container not found")
+
+        self.scrapper.set_root(div)
+
+        self.assertIsNone(self.scrapper.find_one("h1"))
+        self.assertEqual(len(self.scrapper.find_all("p")), 3)
+        self.assertIs(self.scrapper.find_one("p", "b"), div.find("p", class_="b"))
+
+    def test_parse_only(self) -> None:
+        source_code: str = self.simple_source_code.replace("<body>", "<body><p class='a b'>ab</p><p class='a'>a</p><p id='c'>c</p>")
+
+        for parser in Scrapper.PARSERS[:2]:
+            scrapper: Scrapper = Scrapper(source_code, parser, "p.b.a")
+
+            self.assertIsNone(scrapper.find_one("head"))
+            self.assertEqual([p.text for p in scrapper.find_all("p")], ["ab"])
+            self.assertEqual([p.text for p in Scrapper(source_code, parser, "#c").find_all("p")], ["c"])
+
+        with self.assertRaises(ValueError):
+            Scrapper.create_strainer("div > p")
+
+    def test_get_content_single_pass(self) -> None:
+        scrapper: Scrapper = Scrapper("<div> A <!-- comment --><script>x = 1</script><img src='i.png'><img><p>B\n C<a href='#'>D</a></p><video src='v.mp4'></video></div>")
+        div: Tag | None = scrapper.find_one("div")
+
+        if not div:
+            self.fail("Div not found")
+
+        content: Content = scrapper.get_content(div)
+
+        self.assertEqual(content.text, "TEXT A B C D")
+        self.assertEqual(content.images, "IMAGES\nImage: i.png")
+        self.assertEqual(content.videos, "VIDEOS\nVideo: v.mp4")
+        self.assertEqual(content.links, "LINKS\nLink: #")
+        self.assertEqual(scrapper.get_content(Tag(name="p")).text, "TEXT")
+
+    def test_extract_schema(self) -> None:
+        schema: Schema = Schema(
+            {
+                "title": Field("main > h1", required=True, process=str.lower),
+                "classes": Field("div.container p.a", attribute="class", many=True),
+                "link": Field("p.b a", attribute="href"),
+                "video": Field("#video", tag=True),
+                "missing": Field("table", default=""),
+            }
+        )
+
+        values: dict = self.scrapper.extract(schema)
+
+        self.assertEqual(values["title"], "my title")
+        self.assertEqual(values["classes"], ["a b", "a c"])
+        self.assertEqual(values["link"], "about:blank")
+        self.assertEqual(values["video"].name, "video")
+        self.assertEqual(values["missing"], "")
+
+        with self.assertRaises(SchemaException):
+            self.scrapper.extract(Schema({"table": Field("table", required=True)}))
+
+    def test_select(self) -> None:
+        compile_selector.cache_clear()
+
+        for _ in range(3):
+            self.assertEqual([p.text.strip() for p in self.scrapper.select("p.c")], ["Text without link."])
+            self.assertEqual(self.scrapper.select("div.container > p", limit=2), self.scrapper.find_all("p")[:2])
+
+        div: Tag | None = self.scrapper.select_one("div.container")
+
+        self.assertIsNotNone(div)
+        self.assertIsNone(self.scrapper.select_one("h1", element=div))
+        self.assertEqual(compile_selector.cache_info().misses, 4)
@@ -0,0 +1,78 @@
+import os
+import time
+import unittest
+from typing import Any, List
+
+from openpyxl import load_workbook
+
+from webscrapper.sink import JsonLinesSink, Sink, SqliteSink
+from webscrapper.utils import Files
+
+
+class SinkTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.columns: List[str] = ["number", "page", "text"]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        for name in ["test-sink.jsonl", "test-sink.sqlite", "test-sink.sqlite-wal", "test-sink.sqlite-shm", "test-sink.xlsx"]:
+            path: str = Files.create_path_outside(name)
+            if os.path.exists(path):
+                os.remove(path)
+        return super().tearDown()
+
+    def check_sink(self, sink: Sink) -> None:
+        sink.write({"number": 1, "page": 1, "text": "first"})
+        sink.write({"number": 2, "page": 1, "text": "second"})
+
+        self.assertEqual(list(sink.read()), [])
+
+        sink.write({"number": 1, "page": 1, "text": "replaced"})
+
+        records: List[dict[str, Any]] = list(sink.read())
+
+        self.assertEqual([record["text"] for record in records], ["replaced", "second"])
+
+    def test_json_lines_sink(self) -> None:
+        sink: JsonLinesSink = JsonLinesSink("test-sink", self.columns, "number", batch_size=3)
+        self.check_sink(sink)
+        sink.close()
+
+        with open(Files.create_path_outside("test-sink.jsonl"), mode="a", encoding="utf8") as file:
+            file.write('{"number": 3, "pa')
+
+        reopened: JsonLinesSink = JsonLinesSink("test-sink", self.columns, "number")
+        self.assertEqual(len(list(reopened.read())), 2)
+
+    def test_sqlite_sink(self) -> None:
+        sink: SqliteSink = SqliteSink("test-sink", self.columns, "number", batch_size=3)
+        self.check_sink(sink)
+        sink.close()
+
+    def test_flush_seconds(self) -> None:
+        sink: JsonLinesSink = JsonLinesSink("test-sink", self.columns, "number", flush_seconds=0.1)
+        sink.write({"number": 1, "page": 1, "text": "first"})
+
+        self.assertEqual(list(sink.read()), [])
+
+        time.sleep(0.3)
+
+        self.assertEqual(len(list(sink.read())), 1)
+        sink.close()
+
+    def test_export(self) -> None:
+        sink: JsonLinesSink = JsonLinesSink("test-sink", self.columns, "number")
+
+        for number in [3, 1, 2, 150]:
+            sink.write({"number": number, "page": number, "text": f"text {number}"})
+
+        sink.export("test-sink", lambda record: "0" if record["page"] < 100 else "1", "number")
+        sink.close()
+
+        workbook = load_workbook(Files.create_path_outside("test-sink.xlsx"), read_only=True)
+
+        self.assertEqual(workbook.sheetnames, ["0", "1"])
+        self.assertEqual(list(workbook["0"].iter_rows(values_only=True)), [("number", "page", "text"), (1, 1, "text 1"), (2, 2, "text 2"), (3, 3, "text 3")])
+
+        workbook.close()
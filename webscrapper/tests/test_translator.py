@@ -1,6 +1,7 @@
+import time
 import unittest
 
-from webscrapper.translator import Translator
+from webscrapper.translator import LocalBackend, Translator
 
 
 class TranslatorTest(unittest.TestCase):
@@ -19,3 +20,65 @@ class TranslatorTest(unittest.TestCase):
         translation = self.translator.translate(text)
 
         print(translation)
+
+    @unittest.skip("Success")
+    def test_translate_batch(self):
+        texts = ["Hola", "Adiós", "", "Hola"]
+
+        translations = self.translator.translate_batch(texts)
+
+        self.assertEqual(len(translations), 4)
+        self.assertEqual(translations[0], translations[3])
+        self.assertEqual(translations[2], "")
+
+
+class LocalTranslatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.backend: LocalBackend = LocalBackend(max_segments=4, max_characters=20)
+        self.translator: Translator = Translator("zh-CN", "es", workers=4, backend=self.backend)
+        return super().setUp()
+
+    def test_translate_batch_order_and_deduplication(self) -> None:
+        texts: list = ["一", "二", "", "一", b"\xe4\xb8\x89", "四", "五", "六"]
+
+        translations: list = self.translator.translate_batch(texts)
+
+        self.assertEqual(translations, ["[es] 一", "[es] 二", "", "[es] 一", "[es] 三", "[es] 四", "[es] 五", "[es] 六"])
+        self.assertEqual(self.backend.requests, 2)
+
+    def test_translate_batch_limits(self) -> None:
+        texts: list = [f"{index:02d}{'x' * 6}" for index in range(10)]
+
+        self.assertEqual(len(self.translator.translate_batch(texts)), 10)
+        self.assertEqual(self.backend.requests, 5)
+
+    def test_translate_batch_concurrency(self) -> None:
+        translator: Translator = Translator("zh-CN", "es", workers=4, backend=LocalBackend(latency=0.2, max_segments=1))
+
+        start: float = time.perf_counter()
+        translator.translate_batch(["一", "二", "三", "四"])
+
+        self.assertLess(time.perf_counter() - start, 0.6)
+
+    def test_segment(self) -> None:
+        text: str = "我们是制造商。产品质量好！\n联系我们? Call us. Now;ok"
+
+        pieces: list = self.translator.segment(text)
+
+        self.assertEqual("".join(pieces), text)
+        self.assertEqual(pieces[::2], ["我们是制造商。", "产品质量好！", "联系我们?", "Call us.", "Now;", "ok"])
+        self.assertTrue(all(len(piece) <= 20 for piece in self.translator.segment("字" * 45)))
+
+    def test_translate_batch_segments(self) -> None:
+        backend: LocalBackend = LocalBackend()
+        translator: Translator = Translator("zh-CN", "es", backend=backend, segment_length=10)
+        boilerplate: str = "欢迎光临我们的展位。"
+
+        translations: list = translator.translate_batch([f"公司甲生产医疗设备。{boilerplate}", f"公司乙生产医用耗材。{boilerplate}\n谢谢", "短文本。短文本。"])
+
+        self.assertEqual(translations[0], f"[es] 公司甲生产医疗设备。 [es] {boilerplate}")
+        self.assertEqual(translations[1], f"[es] 公司乙生产医用耗材。 [es] {boilerplate}\n[es] 谢谢")
+        self.assertEqual(translations[2], "[es] 短文本。短文本。")
+        self.assertEqual(backend.requests, 1)
+        self.assertEqual(Translator("es", "zh-CN", backend=backend, segment_length=5).translate_batch(["Hola. Adiós."]), ["[zh-CN] Hola. [zh-CN] Adiós."])
@@ -1,4 +1,6 @@
-import time
+import json
+import queue
+import threading
 from typing import Any, List
 
 from selenium.common.exceptions import ElementNotInteractableException, JavascriptException, NoSuchElementException, NoSuchWindowException, TimeoutException, WebDriverException
@@ -11,15 +13,19 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import WebDriverWait
 
+from webscrapper.scrapper import Schema, Scrapper
 from webscrapper.utils import Files, print_class_name
 
 
 class Browser:
 
     @print_class_name
-    def __init__(self) -> None:
+    def __init__(self, block_resources: bool = False) -> None:
         """
         Start a headless browser with options at chrome-options file.
+
+        Args:
+            block_resources (bool): block requests to the url patterns at blocked-urls file (stylesheets, fonts, images, media and analytics), so pages only load their HTML, scripts and XHRs. False by default
         """
         try:
             print(f"Starting browser")
@@ -50,9 +56,25 @@ class Browser:
 
             self.__driver: WebDriver = WebDriver(service=self.__service, options=self.__options)
 
+            self.__blocked_urls: List[str] = []
+            self.__tab_pool: List[str] = []
+
+            if block_resources:
+                self.__blocked_urls = [line for line in Files.read_file(Files.create_path_inside("data\\blocked-urls.txt")) if line and not line.startswith("#")]
+                self.__block_urls()
+
         except WebDriverException as e:
             raise BrowserException(Browser, "Browser error at constructor", e)
 
+    def __block_urls(self) -> None:
+        # Blocking applies to the current tab only, so it is repeated on every tab switch
+        if self.__blocked_urls:
+            try:
+                self.__driver.execute_cdp_cmd("Network.enable", {})
+                self.__driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.__blocked_urls})
+            except WebDriverException as e:
+                BrowserException.print_exception(self.__block_urls, f"Browser error blocking {len(self.__blocked_urls)} url patterns", e)
+
     def get_page_source_code(self) -> str:
         """
         Return page source code.
@@ -117,12 +139,13 @@ class Browser:
 
         Args:
             url (str): url to go. about:blank by default
-            seconds (int): waiting time for the page to load. 0 s by default
+            seconds (int): maximum waiting time for the page to be ready and idle. 0 s by default
         """
         try:
             # print(f"Going to {url[0:50]}...")
             self.__driver.get(url)
-            time.sleep(seconds)
+            if seconds:
+                self.wait_ready(timeout=seconds, idle=0.5)
         except WebDriverException as e:
             BrowserException.print_exception(self.go_to_url, f"Browser error going to URL {url[:50]}...", e)
 
@@ -133,14 +156,18 @@ class Browser:
 
         Args:
             url (str): new tab url. about:blank by default
-            seconds (int): waiting time for the page to load. 0 s by default
+            seconds (int): maximum waiting time for the new tab to be opened. 0 s by default
         """
         try:
             # print(f"Opening a new tab at {url[:50]}...")
+            tabs: int = len(self.__driver.window_handles)
             self.__driver.execute_script(f"window.open('{url}', '_blank');")
-            time.sleep(seconds)
+            if seconds:
+                WebDriverWait(self.__driver, seconds, poll_frequency=0.1).until(expected_conditions.number_of_windows_to_be(tabs + 1))
         except JavascriptException as e:
             BrowserException.print_exception(self.open_tab, f"JS error opening tab at {url[:50]}...", e)
+        except TimeoutException as e:
+            BrowserException.print_exception(self.open_tab, f"Time exceeded opening tab at {url[:50]}...", e)
 
     # @print_class_name
     def go_to_tab(self, index: int, seconds: int = 0) -> None:
@@ -149,13 +176,15 @@ class Browser:
 
         Args:
             index (int): tab index; first index = 1
-            seconds (int): waiting time for the page to load. 0 s by default
+            seconds (int): maximum waiting time for the page to be ready and idle. 0 s by default
         """
         try:
             if index > 0:
                 # print(f"Going to tab {index}")
                 self.__driver.switch_to.window(self.__driver.window_handles[index - 1])
-                time.sleep(seconds)
+                self.__block_urls()
+                if seconds:
+                    self.wait_ready(timeout=seconds, idle=0.5)
         except NoSuchWindowException as e:
             BrowserException.print_exception(self.go_to_tab, f"Unable to go to tab {index}", e)
 
@@ -186,6 +215,57 @@ class Browser:
         except WebDriverException as e:
             BrowserException.print_exception(self.close_tab, f"Browser error closing tab {index}", e)
 
+    # @print_class_name
+    def open_tab_pool(self, size: int) -> None:
+        """
+        Open tabs until there are size of them and cache their handles, so the tabs are kept warm and switched without looking up window handles.
+
+        Args:
+            size (int): number of tabs in the pool
+        """
+        try:
+            handles: List[str] = list(self.__driver.window_handles)
+
+            while len(handles) < size:
+                self.__driver.switch_to.new_window("tab")
+                handles.append(self.__driver.current_window_handle)
+                self.__block_urls()
+
+            self.__tab_pool = handles[:size]
+            self.__driver.switch_to.window(self.__tab_pool[0])
+        except WebDriverException as e:
+            BrowserException.print_exception(self.open_tab_pool, f"Browser error opening a pool of {size} tabs", e)
+
+    @property
+    def tab_pool_size(self) -> int:
+        return len(self.__tab_pool)
+
+    # @print_class_name
+    def go_to_pooled_tab(self, index: int) -> None:
+        """
+        Go to the pooled tab at index with its cached handle.
+
+        Args:
+            index (int): pooled tab index; first index = 1
+        """
+        try:
+            self.__driver.switch_to.window(self.__tab_pool[index - 1])
+        except (IndexError, NoSuchWindowException) as e:
+            BrowserException.print_exception(self.go_to_pooled_tab, f"Unable to go to pooled tab {index}", e)
+
+    # @print_class_name
+    def load_url(self, url: str) -> None:
+        """
+        Start loading url in the current tab without waiting for it. The current document is emptied first, so the following waits only find elements of the new page.
+
+        Args:
+            url (str): url to load
+        """
+        try:
+            self.__driver.execute_script("document.documentElement.replaceChildren(); window.location.href = arguments[0];", url)
+        except JavascriptException as e:
+            BrowserException.print_exception(self.load_url, f"JS error loading URL {url[:50]}...", e)
+
     # @print_class_name
     def delete_scripts(self) -> None:
         """
@@ -194,22 +274,152 @@ class Browser:
         try:
             # print(f"Deleting scripts...")
             deletion_code: str = """
-                    (() => {
-                        let scripts = document.getElementsByTagName('script');
-                        for (var i = 0; i < scripts.length; i++) {
-                            scripts[i].parentNode.removeChild(scripts[i]);
-                        }
-                        return scripts.length > 0
-                    })()
+                    document.querySelectorAll('script').forEach((script) => script.remove());
+                    return document.getElementsByTagName('script').length > 0;
                 """
             page_has_scripts: bool = True
+            attempts: int = 0
 
-            while page_has_scripts:
+            while page_has_scripts and attempts < 10:
                 page_has_scripts = self.__driver.execute_script(deletion_code)
-                time.sleep(1)
+                attempts += 1
         except JavascriptException as e:
             BrowserException.print_exception(self.delete_scripts, f"JS error deleting page scripts", e)
 
+    # @print_class_name
+    def wait_ready(self, selectors: List[str] | str | None = None, timeout: float = 10, idle: float = 0, poll: float = 0.1) -> bool:
+        """
+        Wait until the page is ready: document loaded, every css selector present and, if idle is given, no DOM mutations nor new network requests during idle seconds.
+
+        Every poll checks the whole condition with a single script, so the waiting time is shared by all selectors.
+
+        Requests are seen through the resource timing entries, which are cleared on every poll. Only finished requests are recorded, so a request still in flight after idle seconds without other activity does not keep the page busy.
+
+        Args:
+            selectors (List[str] | str | None): css selectors that must be present. None by default
+            timeout (float): maximum waiting time. 10 s by default
+            idle (float): seconds without DOM mutations and requests to consider the page idle. 0 s (not checked) by default
+            poll (float): seconds between checks. 0.1 s by default
+        Returns:
+            bool; False if time was exceeded
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+
+        readiness_code: str = """
+                const [selectors, idle] = arguments;
+                const now = performance.now();
+                if (!window.__webscrapperObserver) {
+                    window.__webscrapperMutation = now;
+                    window.__webscrapperRequest = now;
+                    performance.setResourceTimingBufferSize(10000);
+                    window.__webscrapperObserver = new MutationObserver(() => { window.__webscrapperMutation = performance.now(); });
+                    window.__webscrapperObserver.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+                }
+                if (performance.getEntriesByType('resource').length) {
+                    // Cleared on every check, so a full buffer never stops recording new requests
+                    performance.clearResourceTimings();
+                    window.__webscrapperRequest = now;
+                }
+                return document.readyState !== 'loading'
+                    && selectors.every((selector) => document.querySelector(selector) !== null)
+                    && now - window.__webscrapperMutation >= idle
+                    && now - window.__webscrapperRequest >= idle;
+            """
+
+        try:
+            # print(f"Waiting for the page to be ready...")
+            WebDriverWait(self.__driver, timeout, poll_frequency=poll).until(lambda driver: driver.execute_script(readiness_code, selectors or [], idle * 1000))
+            return True
+        except TimeoutException as e:
+            BrowserException.print_exception(self.wait_ready, f"Time exceeded waiting for the page to be ready with css selectors {selectors}", e)
+            return False
+        except JavascriptException as e:
+            BrowserException.print_exception(self.wait_ready, f"JS error waiting for the page to be ready", e)
+            return False
+
+    # @print_class_name
+    def wait_all_present(self, selectors: List[str], timeout: float = 10, poll: float = 0.1) -> List[str]:
+        """
+        Wait for the presence of elements with all the given css selectors, checking them with one script per poll.
+
+        Args:
+            selectors (List[str]): css selectors to wait
+            timeout (float): maximum waiting time shared by all selectors. 10 s by default
+            poll (float): seconds between checks. 0.1 s by default
+        Returns:
+            List[str]; selectors present when all of them matched or time was exceeded
+        """
+        presence_code: str = "return arguments[0].map((selector) => document.querySelector(selector) !== null);"
+        present: List[bool] = [False] * len(selectors)
+
+        def all_present(driver: WebDriver) -> bool:
+            nonlocal present
+            present = driver.execute_script(presence_code, selectors)
+            return all(present)
+
+        try:
+            # print(f"Waiting presence of elements with css selectors {selectors}...")
+            WebDriverWait(self.__driver, timeout, poll_frequency=poll).until(all_present)
+        except TimeoutException as e:
+            missing: List[str] = [selector for selector, found in zip(selectors, present) if not found]
+            BrowserException.print_exception(self.wait_all_present, f"Time exceeded waiting for elements with css selectors {missing}", e)
+        except JavascriptException as e:
+            BrowserException.print_exception(self.wait_all_present, f"JS error waiting for elements with css selectors {selectors}", e)
+
+        return [selector for selector, found in zip(selectors, present) if found]
+
+    # @print_class_name
+    def extract(self, schema: Schema, root: str | None = None) -> dict[str, Any]:
+        """
+        Extract the fields of a schema inside the page with a single script that returns them as JSON, without transferring nor parsing the page source code.
+
+        Tag fields return the outer HTML of their element, parsed alone in Python.
+
+        Args:
+            schema (Schema): extraction schema
+            root (str | None): css selector of the element to extract from. The whole document by default
+        Returns:
+            dict[str, Any]
+        """
+        extraction_code: str = """
+                const [fields, rootSelector] = arguments;
+                const root = rootSelector ? document.querySelector(rootSelector) : document;
+                const values = {};
+                if (root) {
+                    const read = (element, field) => field.tag ? element.outerHTML : field.attribute ? element.getAttribute(field.attribute) : element.textContent;
+                    for (const field of fields) {
+                        if (field.many) {
+                            values[field.name] = Array.from(root.querySelectorAll(field.selector), (element) => read(element, field));
+                        } else {
+                            const element = root.querySelector(field.selector);
+                            values[field.name] = element ? read(element, field) : null;
+                        }
+                    }
+                }
+                return JSON.stringify(values);
+            """
+
+        fields: List[dict[str, Any]] = [
+            {"name": name, "selector": field.selector, "attribute": field.attribute, "tag": field.tag, "many": field.many} for name, field in schema.fields.items()
+        ]
+
+        raw: dict[str, Any] = {}
+
+        try:
+            raw = json.loads(self.__driver.execute_script(extraction_code, fields, root))
+        except JavascriptException as e:
+            BrowserException.print_exception(self.extract, f"JS error extracting fields {list(schema.fields)}", e)
+
+        for name, field in schema.fields.items():
+            if field.tag and raw.get(name) is not None:
+                if field.many:
+                    raw[name] = [Scrapper(html).select_one(":root") for html in raw[name]]
+                else:
+                    raw[name] = Scrapper(raw[name]).select_one(":root")
+
+        return schema.complete(raw)
+
     # @print_class_name
     def wait_class_present(self, class_: str) -> None:
         """
@@ -470,6 +680,33 @@ class Browser:
             BrowserException.print_exception(self.find_one_by_xpath, f"Element with xpath {xpath} not found", e)
             return None
 
+    def is_alive(self) -> bool:
+        """
+        Check if the browser still answers commands.
+
+        Returns:
+            bool
+        """
+        try:
+            return self.__driver.execute_script("return true;") is True
+        except WebDriverException:
+            return False
+
+    def get_memory(self) -> int:
+        """
+        Return the JavaScript heap used by the current tab, in bytes.
+
+        Returns:
+            int; 0 if it can't be read
+        """
+        try:
+            self.__driver.execute_cdp_cmd("Performance.enable", {})
+            metrics: dict[str, Any] = self.__driver.execute_cdp_cmd("Performance.getMetrics", {})
+            return next((int(metric["value"]) for metric in metrics.get("metrics", []) if metric["name"] == "JSHeapUsedSize"), 0)
+        except WebDriverException as e:
+            BrowserException.print_exception(self.get_memory, "Browser error getting performance metrics", e)
+            return 0
+
     @print_class_name
     def quit(self) -> None:
         """
@@ -482,6 +719,119 @@ class Browser:
             BrowserException.print_exception(self.quit, "Browser error on quit", e)
 
 
+class BrowserPool:
+
+    @print_class_name
+    def __init__(self, size: int, block_resources: bool = False, tabs: int = 1, max_pages: int = 500, max_memory: int = 512 * 1024**2) -> None:
+        """
+        Create a pool of browsers started on demand. A browser is checked before being handed out and replaced if it crashed, and it is recycled after max_pages pages or when its JavaScript heap exceeds max_memory.
+
+        Args:
+            size (int): maximum number of browsers
+            block_resources (bool): browsers block the url patterns at blocked-urls file. False by default
+            tabs (int): warm tabs opened on every browser. 1 by default
+            max_pages (int): pages browsed before a browser is recycled. 500 by default
+            max_memory (int): JavaScript heap bytes above which a browser is recycled. 512 MiB by default
+        """
+        print(f"Starting a pool of {size} browsers")
+
+        self.__block_resources: bool = block_resources
+        self.__tabs: int = tabs
+        self.__max_pages: int = max_pages
+        self.__max_memory: int = max_memory
+        self.__idle: queue.LifoQueue[Browser] = queue.LifoQueue()
+        self.__pages: dict[Browser, int] = {}
+        self.__lock: threading.Lock = threading.Lock()
+        self.__available: threading.Semaphore = threading.Semaphore(size)
+
+    def __start(self) -> Browser:
+        browser: Browser = Browser(self.__block_resources)
+
+        if self.__tabs > 1:
+            browser.open_tab_pool(self.__tabs)
+
+        with self.__lock:
+            self.__pages[browser] = 0
+
+        return browser
+
+    def __retire(self, browser: Browser) -> None:
+        with self.__lock:
+            self.__pages.pop(browser, None)
+
+        browser.quit()
+
+    def acquire(self) -> Browser:
+        """
+        Wait for a free browser, replacing it if it crashed, or start one while the pool is not full.
+
+        Returns:
+            Browser
+        """
+        self.__available.acquire()
+
+        try:
+            while True:
+                try:
+                    browser: Browser = self.__idle.get_nowait()
+                except queue.Empty:
+                    return self.__start()
+
+                if browser.is_alive():
+                    return browser
+
+                print("Replacing crashed browser")
+                self.__retire(browser)
+        except BaseException:
+            self.__available.release()
+            raise
+
+    def release(self, browser: Browser, pages: int = 1) -> None:
+        """
+        Give back a browser, recycling it if it crashed, browsed too many pages or uses too much memory.
+
+        Args:
+            browser (Browser): browser taken with acquire
+            pages (int): pages browsed since it was taken. 1 by default
+        """
+        try:
+            with self.__lock:
+                browsed: int = self.__pages.get(browser, 0) + pages
+                self.__pages[browser] = browsed
+
+            if not browser.is_alive():
+                print("Replacing crashed browser")
+                self.__retire(browser)
+            elif browsed >= self.__max_pages:
+                print(f"Recycling browser after {browsed} pages")
+                self.__retire(browser)
+            elif (memory := browser.get_memory()) > self.__max_memory:
+                print(f"Recycling browser using {memory / 1024**2:.0f} MiB")
+                self.__retire(browser)
+            else:
+                self.__idle.put(browser)
+        finally:
+            self.__available.release()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__pages)
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Quit every browser of the pool.
+        """
+        print("Closing browser pool")
+
+        with self.__lock:
+            browsers: List[Browser] = list(self.__pages)
+            self.__pages.clear()
+
+        for browser in browsers:
+            browser.quit()
+
+
 class BrowserException(Exception):
     """Exception raised for browser exceptions.
 
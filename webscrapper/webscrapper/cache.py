@@ -0,0 +1,196 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator
+
+from webscrapper.utils import Files, print_class_name
+
+
+class ResponseCache:
+
+    @print_class_name
+    def __init__(self, name: str = "cache", max_bytes: int = 2 * 1024**3) -> None:
+        """
+        Open or create an on-disk cache of page source codes at a folder in package parent folder.
+
+        Pages are stored once per content as compressed blobs named by their hash, and the least recently used urls are evicted when blobs exceed max_bytes.
+
+        Args:
+            name (str): cache folder name. cache by default
+            max_bytes (int): maximum size of the compressed blobs. 2 GiB by default
+        """
+        print(f"Opening cache {name}")
+
+        self.__folder: str = Files.create_path_outside(name)
+        self.__max_bytes: int = max_bytes
+        self.__lock: threading.Lock = threading.Lock()
+
+        os.makedirs(self.__folder, exist_ok=True)
+
+        self.__connection: sqlite3.Connection = sqlite3.connect(os.path.join(self.__folder, "index.sqlite"), check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                etag TEXT NOT NULL DEFAULT '',
+                last_modified TEXT NOT NULL DEFAULT '',
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL)")
+        self.__connection.commit()
+
+    def __get_blob_path(self, digest: str) -> str:
+        return os.path.join(self.__folder, digest[:2], f"{digest}.html.gz")
+
+    @staticmethod
+    def read_blob(path: str) -> str:
+        """
+        Return the source code stored at a blob path.
+
+        Args:
+            path (str): blob path
+        Returns:
+            str
+        """
+        with gzip.open(path, mode="rt", encoding="utf8") as file:
+            return file.read()
+
+    def get(self, url: str) -> str | None:
+        """
+        Return the cached source code of url.
+
+        Args:
+            url (str): page url
+        Returns:
+            str | None
+        """
+        with self.__lock:
+            row: tuple | None = self.__connection.execute("SELECT digest FROM responses WHERE url = ?", (url,)).fetchone()
+
+            if not row:
+                return None
+
+            with self.__connection:
+                self.__connection.execute("UPDATE responses SET accessed = ? WHERE url = ?", (time.time(), url))
+
+        try:
+            return ResponseCache.read_blob(self.__get_blob_path(row[0]))
+        except OSError:
+            return None
+
+    def get_validators(self, url: str) -> dict[str, str]:
+        """
+        Return the conditional request headers to revalidate the cached response of url.
+
+        Args:
+            url (str): page url
+        Returns:
+            dict[str, str]; If-None-Match and If-Modified-Since when known
+        """
+        with self.__lock:
+            row: tuple | None = self.__connection.execute("SELECT etag, last_modified FROM responses WHERE url = ?", (url,)).fetchone()
+
+        headers: dict[str, str] = {}
+
+        if row:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+
+        return headers
+
+    def put(self, url: str, source_code: str, etag: str = "", last_modified: str = "") -> None:
+        """
+        Store the source code of url.
+
+        Args:
+            url (str): page url
+            source_code (str): page source code
+            etag (str): ETag response header. "" by default
+            last_modified (str): Last-Modified response header. "" by default
+        """
+        data: bytes = source_code.encode("utf8")
+        digest: str = hashlib.sha256(data).hexdigest()
+        path: str = self.__get_blob_path(digest)
+
+        with self.__lock:
+            known: bool = bool(self.__connection.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone())
+
+            if not known or not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                compressed: bytes = gzip.compress(data, compresslevel=6)
+                temporary_path: str = f"{path}.{threading.get_ident()}.tmp"
+                with open(temporary_path, mode="wb") as file:
+                    file.write(compressed)
+                os.replace(temporary_path, path)
+
+            with self.__connection:
+                if not known:
+                    self.__connection.execute("INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)", (digest, os.path.getsize(path)))
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO responses (url, digest, etag, last_modified, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (url, digest, etag, last_modified, time.time()),
+                )
+
+            self.__evict()
+
+    def __evict(self) -> None:
+        while self.__get_size() > self.__max_bytes:
+            urls: list[tuple] = self.__connection.execute("SELECT url FROM responses ORDER BY accessed LIMIT 100").fetchall()
+
+            if not urls:
+                break
+
+            with self.__connection:
+                self.__connection.executemany("DELETE FROM responses WHERE url = ?", urls)
+                unused: list[tuple] = self.__connection.execute("SELECT digest FROM blobs WHERE digest NOT IN (SELECT digest FROM responses)").fetchall()
+                self.__connection.executemany("DELETE FROM blobs WHERE digest = ?", unused)
+
+            for (digest,) in unused:
+                try:
+                    os.remove(self.__get_blob_path(digest))
+                except OSError:
+                    pass
+
+    def __get_size(self) -> int:
+        return self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        with self.__lock:
+            return self.__get_size()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def entries(self) -> Iterator[tuple[str, str]]:
+        """
+        Return the url and blob path of every cached page.
+
+        Returns:
+            Iterator[tuple[str, str]]
+        """
+        with self.__lock:
+            rows: list[tuple] = self.__connection.execute("SELECT url, digest FROM responses ORDER BY rowid").fetchall()
+
+        for url, digest in rows:
+            yield url, self.__get_blob_path(digest)
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Close the cache index.
+        """
+        print("Closing cache")
+        self.__connection.close()
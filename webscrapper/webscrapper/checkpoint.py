@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from webscrapper.utils import Files, print_class_name
+
+
+@dataclass
+class Entry:
+
+    url: str
+    status: str
+    attempts: int
+    error: str
+    updated: float
+
+
+class Checkpoint:
+
+    DONE: str = "done"
+    FAILED: str = "failed"
+
+    @print_class_name
+    def __init__(self, name: str) -> None:
+        """
+        Open or create a SQLite checkpoint store with the state of every url, at package parent folder.
+
+        Args:
+            name (str): store name without extension
+        """
+        print(f"Opening checkpoint {name}")
+
+        self.__lock: threading.Lock = threading.Lock()
+        self.__connection: sqlite3.Connection = sqlite3.connect(Files.create_path_outside(f"{name}.sqlite"), check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT NOT NULL DEFAULT '',
+                updated REAL NOT NULL
+            )
+            """
+        )
+        self.__connection.commit()
+
+    def get(self, url: str) -> Entry | None:
+        """
+        Return the checkpoint of url.
+
+        Args:
+            url (str): url to look up
+        Returns:
+            Entry | None
+        """
+        with self.__lock:
+            row: tuple | None = self.__connection.execute("SELECT url, status, attempts, error, updated FROM checkpoints WHERE url = ?", (url,)).fetchone()
+
+        return Entry(*row) if row else None
+
+    def is_done(self, url: str) -> bool:
+        """
+        Check if url was completed.
+
+        Args:
+            url (str): url to look up
+        Returns:
+            bool
+        """
+        entry: Entry | None = self.get(url)
+        return bool(entry and entry.status == Checkpoint.DONE)
+
+    def update(self, entries: Iterable[tuple[str, str, int, str]]) -> None:
+        """
+        Save the status of many urls in a single transaction, adding up their attempts.
+
+        Args:
+            entries (Iterable[tuple[str, str, int, str]]): (url, status, attempts, error) of each url
+        """
+        now: float = time.time()
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                """
+                INSERT INTO checkpoints (url, status, attempts, error, updated) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = attempts + excluded.attempts,
+                    error = excluded.error,
+                    updated = excluded.updated
+                """,
+                [(url, status, attempts, error, now) for url, status, attempts, error in entries],
+            )
+
+    def mark_done(self, url: str, attempts: int = 1) -> None:
+        """
+        Save url as completed.
+
+        Args:
+            url (str): completed url
+            attempts (int): attempts made. 1 by default
+        """
+        self.update([(url, Checkpoint.DONE, attempts, "")])
+
+    def mark_failed(self, url: str, error: str, attempts: int = 1) -> None:
+        """
+        Save url as failed with its last error.
+
+        Args:
+            url (str): failed url
+            error (str): last error
+            attempts (int): attempts made. 1 by default
+        """
+        self.update([(url, Checkpoint.FAILED, attempts, error)])
+
+    def count(self, status: str) -> int:
+        """
+        Count urls with the given status.
+
+        Args:
+            status (str): Checkpoint.DONE or Checkpoint.FAILED
+        Returns:
+            int
+        """
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM checkpoints WHERE status = ?", (status,)).fetchone()[0]
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Close the checkpoint store.
+        """
+        print("Closing checkpoint")
+        self.__connection.close()
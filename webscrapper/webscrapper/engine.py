@@ -0,0 +1,176 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Iterable, List
+from urllib.parse import urlsplit
+
+from webscrapper.fetcher import FetcherException, HttpFetcher
+from webscrapper.utils import print_class_name
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        """
+        Create a token bucket that allows rate requests per second with bursts up to capacity.
+
+        Args:
+            rate (float): tokens added per second
+            capacity (int): maximum tokens stored. 1 by default
+        """
+        self.__rate: float = rate
+        self.__capacity: float = float(capacity)
+        self.__tokens: float = float(capacity)
+        self.__updated: float | None = None
+        self.__lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        async with self.__lock:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+            while True:
+                now: float = loop.time()
+
+                if self.__updated is not None:
+                    self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+                self.__updated = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+
+class FetchEngine:
+
+    @print_class_name
+    def __init__(self, concurrency: int = 100, rate: float = 5, burst: int = 10, fetcher: HttpFetcher | None = None) -> None:
+        """
+        Create an asynchronous engine that fetches many pages at once.
+
+        Requests are sent by the HTTP fetcher on a thread pool as big as the concurrency, so the event loop is never blocked.
+
+        Args:
+            concurrency (int): maximum requests in flight. 100 by default
+            rate (float): maximum requests per second to the same host. 5 by default
+            burst (int): requests allowed at once to the same host before rate limiting. 10 by default
+            fetcher (HttpFetcher | None): fetcher used to send requests. A new one by default
+        """
+        print(f"Starting fetch engine with {concurrency} requests in flight")
+
+        self.__concurrency: int = concurrency
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__fetcher: HttpFetcher = fetcher or HttpFetcher(connections=concurrency)
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fetch")
+        self.__buckets: dict[str, TokenBucket] = {}
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__cancelled: asyncio.Event | None = None
+        self.failures: dict[str, Exception] = {}
+
+    def __get_bucket(self, url: str) -> TokenBucket:
+        host: str = urlsplit(url).netloc
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Bucket locks are bound to the event loop that first uses them, so every run of the engine gets its own buckets
+        if loop is not self.__loop:
+            self.__loop = loop
+            self.__buckets = {}
+
+        if host not in self.__buckets:
+            self.__buckets[host] = TokenBucket(self.__rate, self.__burst)
+
+        return self.__buckets[host]
+
+    def cancel(self) -> None:
+        """
+        Stop fetching new urls; requests in flight are finished and yielded.
+        """
+        if self.__cancelled:
+            self.__cancelled.set()
+
+    async def fetch(self, url: str) -> str:
+        """
+        Fetch the page at url respecting the host rate limit.
+
+        Args:
+            url (str): page url
+        Returns:
+            str
+        """
+        await self.__get_bucket(url).acquire()
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.__executor, self.__fetcher.get_page_source_code, url)
+
+    async def fetch_many(self, urls: Iterable[str]) -> AsyncGenerator[tuple[str, str], None]:
+        """
+        Fetch all urls concurrently and yield (url, html) as soon as each one completes.
+
+        Urls that fail are not yielded; they are stored with their exception at failures.
+
+        Args:
+            urls (Iterable[str]): pages urls
+        Returns:
+            AsyncGenerator[tuple[str, str], None]
+        """
+        self.__cancelled = asyncio.Event()
+        cancelled: asyncio.Event = self.__cancelled
+        closed: asyncio.Event = asyncio.Event()
+
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        results: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=self.__concurrency)
+
+        for url in urls:
+            pending.put_nowait(url)
+
+        async def work() -> None:
+            try:
+                while not cancelled.is_set():
+                    try:
+                        url: str = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+
+                    try:
+                        await results.put((url, await self.fetch(url)))
+                    except Exception as e:
+                        # Any error, from the request, the decoding or the cache, fails only this url
+                        self.failures[url] = e
+                        FetcherException.print_exception(self.fetch_many, f"Failed fetching {url[:50]}...", e)
+            finally:
+                if not closed.is_set():
+                    await results.put(None)
+
+        workers: List[asyncio.Task] = [asyncio.create_task(work()) for _ in range(min(self.__concurrency, pending.qsize()))]
+        running: int = len(workers)
+
+        try:
+            while running:
+                result: tuple[str, str] | None = await results.get()
+
+                if result is None:
+                    running -= 1
+                else:
+                    yield result
+        finally:
+            closed.set()
+            cancelled.set()
+
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Shut down the thread pool and close the HTTP fetcher.
+        """
+        print("Closing fetch engine")
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.__fetcher.close()
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Any, Iterable, Iterator, Sequence
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -9,20 +9,30 @@ from webscrapper.utils import Files, print_class_name
 class Excel:
 
     @print_class_name
-    def __init__(self, book_name: str = "book") -> None:
+    def __init__(self, book_name: str = "book", read_only: bool = False, write_only: bool = False) -> None:
         """
         Create a new Excel book with given name or load it if exists at package parent folder.
 
+        A read-only book is streamed from disk instead of being loaded in memory; read it with iter_rows.
+        A write-only book is always created empty, replacing the existing one on save; fill it with append_rows.
+
         Args:
             book_name (str): book to be create it or open it.
+            read_only (bool): open the book in read-only streaming mode. False by default
+            write_only (bool): create the book in write-only streaming mode. False by default
         """
         self.__name: str = book_name
         self.__path: str = Files.create_path_outside(f"{book_name}.xlsx")
+        self.__read_only: bool = read_only
+        self.__write_only: bool = write_only
         self.__workbook: Workbook
 
-        if Files.file_exists(self.__path):
-            print(f"Opening Excel book {self.__name}")
-            self.__workbook = load_workbook(self.__path)
+        if write_only:
+            print(f"Creating Excel book {self.__name} in write-only mode")
+            self.__workbook = Workbook(write_only=True)
+        elif Files.file_exists(self.__path):
+            print(f"Opening Excel book {self.__name}" + (" in read-only mode" if read_only else ""))
+            self.__workbook = load_workbook(self.__path, read_only=read_only)
         else:
             print(f"Creating Excel book {self.__name}")
             self.__workbook = Workbook()
@@ -33,6 +43,10 @@ class Excel:
     def sheets(self) -> Sequence[Worksheet]:
         return self.__workbook.worksheets
 
+    def __check_readable(self) -> None:
+        if self.__write_only:
+            raise ValueError(f"Excel book {self.__name} is write-only and can't be read")
+
     def has_sheet(self, sheet_name: str) -> bool:
         """
         Return true if book contains sheet with given name.
@@ -60,8 +74,9 @@ class Excel:
         Return reference to sheet with given name.
 
         Args:
-            sheet_name (str): name of sheet to be returned.
+            sheet_name (str): name of sheet to be returned. Write-only books can't be read
         """
+        self.__check_readable()
         return self.__workbook[sheet_name]
 
     def delete_sheet(self, sheet_name) -> None:
@@ -73,11 +88,40 @@ class Excel:
         """
         self.__workbook.remove(self.__workbook[sheet_name])
 
+    def iter_rows(self, sheet_name: str, min_row: int = 1) -> Iterator[tuple[Any, ...]]:
+        """
+        Return the values of the rows of sheet with given name, one tuple per row. Rows are streamed on read-only books; write-only books can't be read.
+
+        Args:
+            sheet_name (str): name of sheet to be read.
+            min_row (int): first row to be read. 1 by default
+        Returns:
+            Iterator[tuple[Any, ...]]
+        """
+        self.__check_readable()
+        return self.__workbook[sheet_name].iter_rows(min_row=min_row, values_only=True)
+
+    def append_rows(self, sheet_name: str, rows: Iterable[list[Any] | tuple[Any, ...]]) -> None:
+        """
+        Append rows of values after the last row of sheet with given name.
+
+        Args:
+            sheet_name (str): name of sheet to be filled.
+            rows (Iterable[list[Any] | tuple[Any, ...]]): rows to be appended.
+        """
+        sheet = self.__workbook[sheet_name]
+
+        for row in rows:
+            sheet.append(row)
+
     def save_book(self) -> None:
         """
-        Save Excel book at path.
+        Save Excel book at path. Read-only books can't be saved and write-only books can be saved only once.
         """
-        self.__workbook.save(self.__path)
+        if self.__read_only:
+            print(f"Excel book {self.__name} is read-only")
+        else:
+            self.__workbook.save(self.__path)
 
     @print_class_name
     def close(self) -> None:
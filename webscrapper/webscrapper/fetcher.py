@@ -0,0 +1,144 @@
+from typing import Any
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+from webscrapper.cache import ResponseCache
+from webscrapper.utils import print_class_name
+
+
+class HttpFetcher:
+
+    @print_class_name
+    def __init__(self, connections: int = 10, retries: int = 3, backoff: float = 0.5, timeout: float = 15, cache: ResponseCache | None = None) -> None:
+        """
+        Start an HTTP session with a pool of keep-alive connections and retries with backoff.
+
+        Args:
+            connections (int): connections kept alive per host. 10 by default
+            retries (int): retries for failed connections and server errors. 3 by default
+            backoff (float): backoff factor in seconds between retries. 0.5 s by default
+            timeout (float): seconds to wait for the server response. 15 s by default
+            cache (ResponseCache | None): cache where pages are stored and revalidated with ETag and Last-Modified. None by default
+        """
+        print("Starting HTTP session")
+
+        retry: Retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            respect_retry_after_header=True,
+        )
+
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=connections, pool_maxsize=connections, max_retries=retry)
+
+        self.__session: Session = Session()
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.__session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            }
+        )
+
+        self.__timeout: float = timeout
+        self.__cache: ResponseCache | None = cache
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> Response:
+        """
+        Send a GET request through the session.
+
+        Args:
+            url (str): url to request
+            headers (dict[str, str] | None): extra request headers. None by default
+        Returns:
+            Response
+        """
+        try:
+            response: Response = self.__session.get(url, headers=headers, timeout=self.__timeout)
+            response.raise_for_status()
+            return response
+        except RequestException as e:
+            raise FetcherException(self.get, f"HTTP error requesting {url[:50]}...", e)
+
+    def get_page_source_code(self, url: str) -> str:
+        """
+        Return the HTML source code at url. With a cache, a stored page is only downloaded again if the server reports it changed.
+
+        Args:
+            url (str): page url
+        Returns:
+            str
+        """
+        headers: dict[str, str] = {"Accept": "text/html,application/xhtml+xml"}
+
+        if self.__cache is not None:
+            headers.update(self.__cache.get_validators(url))
+
+        response: Response = self.get(url, headers)
+
+        if response.status_code == 304 and self.__cache is not None:
+            cached: str | None = self.__cache.get(url)
+
+            if cached is not None:
+                return cached
+
+            response = self.get(url, {"Accept": "text/html,application/xhtml+xml"})
+
+        if not response.encoding or response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+
+        if self.__cache is not None:
+            self.__cache.put(url, response.text, response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""))
+
+        return response.text
+
+    def get_json(self, url: str) -> Any:
+        """
+        Return the decoded JSON body at url.
+
+        Args:
+            url (str): endpoint url
+        Returns:
+            Any
+        """
+        response: Response = self.get(url, {"Accept": "application/json"})
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise FetcherException(self.get_json, f"Response of {url[:50]}... is not JSON", e)
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Close the session and its connections.
+        """
+        print("Closing HTTP session")
+        self.__session.close()
+
+
+class FetcherException(Exception):
+    """Exception raised for HTTP fetcher exceptions.
+
+    Args:
+        message (str): exception reason
+    """
+
+    def __init__(self, object_, message: str, exception: Exception) -> None:
+        self.object_name: Any = object_.__name__
+        self.message: str = message
+        self.exception: Exception = exception
+        super().__init__(FetcherException.__format_exception(object_, message, exception))
+
+    @staticmethod
+    def print_exception(object_, message: str, exception: Exception) -> None:
+        print(FetcherException.__format_exception(object_, message, exception))
+
+    @staticmethod
+    def __format_exception(object_, message: str, exception: Exception) -> str:
+        return f"{object_.__name__}: '{message}' | Fetcher exception: {repr(exception)}"
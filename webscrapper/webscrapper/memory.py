@@ -0,0 +1,124 @@
+import hashlib
+import sqlite3
+import threading
+from typing import Iterable, List
+
+from webscrapper.utils import Files, print_class_name
+
+
+class TranslationMemory:
+
+    @print_class_name
+    def __init__(self, name: str = "translations", max_entries: int = 1_000_000) -> None:
+        """
+        Open or create a SQLite store of translations at package parent folder, keyed by the hash of source language, target language and text.
+
+        The least recently used translations are evicted when there are more than max_entries.
+
+        Args:
+            name (str): store name without extension. translations by default
+            max_entries (int): maximum number of translations kept. 1,000,000 by default
+        """
+        print(f"Opening translation memory {name}")
+
+        self.__max_entries: int = max_entries
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        self.__connection: sqlite3.Connection = sqlite3.connect(Files.create_path_outside(f"{name}.sqlite"), check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                used INTEGER NOT NULL
+            )
+            """
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS translations_used ON translations (used)")
+        self.__connection.commit()
+
+        # Order of use; a counter instead of a timestamp, so uses in the same clock tick are still ordered
+        self.__used: int = self.__connection.execute("SELECT COALESCE(MAX(used), 0) FROM translations").fetchone()[0]
+
+    @staticmethod
+    def __get_key(source: str, target: str, text: str) -> str:
+        return hashlib.sha256(f"{source}\0{target}\0{text}".encode("utf8")).hexdigest()
+
+    def get(self, source: str, target: str, texts: Iterable[str]) -> dict[str, str]:
+        """
+        Return the stored translations of texts, counting hits and misses.
+
+        Args:
+            source (str): source language code
+            target (str): target language code
+            texts (Iterable[str]): texts to look up
+        Returns:
+            dict[str, str]; translation of every text found
+        """
+        keys: dict[str, str] = {TranslationMemory.__get_key(source, target, text): text for text in texts}
+        found: dict[str, str] = {}
+
+        with self.__lock:
+            self.__used += 1
+            items: List[str] = list(keys)
+
+            # SQLite limits the number of parameters of a query
+            for start in range(0, len(items), 500):
+                part: List[str] = items[start : start + 500]
+                rows: List[tuple] = self.__connection.execute(f"SELECT key, translation FROM translations WHERE key IN ({', '.join('?' * len(part))})", part).fetchall()
+                found.update((keys[key], translation) for key, translation in rows)
+
+                with self.__connection:
+                    self.__connection.executemany("UPDATE translations SET used = ? WHERE key = ?", [(self.__used, key) for key, _ in rows])
+
+            self.__hits += len(found)
+            self.__misses += len(keys) - len(found)
+
+        return found
+
+    def put(self, source: str, target: str, translations: dict[str, str]) -> None:
+        """
+        Store translations, evicting the least recently used ones above the size cap.
+
+        Args:
+            source (str): source language code
+            target (str): target language code
+            translations (dict[str, str]): translation of every text
+        """
+        with self.__lock:
+            self.__used += 1
+
+            with self.__connection:
+                self.__connection.executemany(
+                    "INSERT OR REPLACE INTO translations (key, translation, used) VALUES (?, ?, ?)",
+                    [(TranslationMemory.__get_key(source, target, text), translation, self.__used) for text, translation in translations.items()],
+                )
+
+            excess: int = self.__connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.__max_entries
+
+            if excess > 0:
+                with self.__connection:
+                    self.__connection.execute("DELETE FROM translations WHERE key IN (SELECT key FROM translations ORDER BY used LIMIT ?)", (excess,))
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    @print_class_name
+    def close(self) -> None:
+        """
+        Close the translation memory.
+        """
+        print(f"Closing translation memory | Hits: {self.__hits} | Misses: {self.__misses}")
+        self.__connection.close()
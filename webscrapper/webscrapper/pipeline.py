@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List
+
+from webscrapper.utils import print_class_name
+
+
+@dataclass
+class Stage:
+    """Step of a pipeline, run by its own threads.
+
+    Args:
+        name (str): stage name
+        function (Callable[[Any], Any]): function applied to every item, returning the item for the next stage or None to drop it. With batch_size above 1 it receives a list of items and returns a list
+        workers (int): threads running the function. 1 by default
+        queue_size (int): items waiting for the stage before the previous one blocks. 100 by default
+        batch_size (int): items given to the function at once. 1 by default
+        batch_seconds (float): maximum seconds waiting to fill a batch. 1 s by default
+    """
+
+    name: str
+    function: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 100
+    batch_size: int = 1
+    batch_seconds: float = 1
+    processed: int = field(default=0, init=False)
+    errors: int = field(default=0, init=False)
+    busy: float = field(default=0, init=False)
+
+
+class Pipeline:
+
+    __END: object = object()
+
+    def __init__(self, stages: List[Stage]) -> None:
+        """
+        Create a pipeline where items flow through the stages over bounded queues, so every stage works at the same time and the slowest one sets the pace.
+
+        Args:
+            stages (List[Stage]): stages in order
+        """
+        self.__stages: List[Stage] = stages
+        self.__queues: List[queue.Queue] = [queue.Queue(maxsize=stage.queue_size) for stage in stages]
+        self.__running: List[int] = [stage.workers for stage in stages]
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def stages(self) -> List[Stage]:
+        return self.__stages
+
+    def __take(self, index: int) -> List[Any] | None:
+        stage: Stage = self.__stages[index]
+        inbox: queue.Queue = self.__queues[index]
+        item: Any = inbox.get()
+
+        if item is Pipeline.__END:
+            return None
+
+        items: List[Any] = [item]
+        deadline: float = time.monotonic() + stage.batch_seconds
+
+        while len(items) < stage.batch_size:
+            try:
+                item = inbox.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+
+            if item is Pipeline.__END:
+                # Left for the next take of this or another worker of the stage
+                inbox.put(item)
+                break
+
+            items.append(item)
+
+        return items
+
+    def __work(self, index: int) -> None:
+        stage: Stage = self.__stages[index]
+        outbox: queue.Queue | None = self.__queues[index + 1] if index + 1 < len(self.__stages) else None
+
+        while (items := self.__take(index)) is not None:
+            start: float = time.perf_counter()
+
+            try:
+                results: List[Any] = stage.function(items) if stage.batch_size > 1 else [stage.function(items[0])]
+            except Exception as e:
+                results = []
+                with self.__lock:
+                    stage.errors += len(items)
+                print(f"Error on stage {stage.name}: {e}")
+
+            with self.__lock:
+                stage.processed += len(items)
+                stage.busy += time.perf_counter() - start
+
+            if outbox is not None:
+                for result in results:
+                    if result is not None:
+                        outbox.put(result)
+
+        self.__finish(index)
+
+    def __finish(self, index: int) -> None:
+        with self.__lock:
+            self.__running[index] -= 1
+            last: bool = self.__running[index] == 0
+
+        if last and index + 1 < len(self.__stages):
+            self.__queues[index + 1].put(Pipeline.__END)
+        elif not last:
+            # Every worker of the stage must see the end
+            self.__queues[index].put(Pipeline.__END)
+
+    @print_class_name
+    def run(self, items: Iterable[Any]) -> None:
+        """
+        Feed items to the first stage from the current thread and wait until every stage has finished them.
+
+        Args:
+            items (Iterable[Any]): source of items; it is consumed only as fast as the first stage takes them
+        """
+        print(f"Running pipeline {' -> '.join(f'{stage.name} ({stage.workers})' for stage in self.__stages)}")
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self.__work, args=(index,), name=f"{stage.name}-{worker}", daemon=True)
+            for index, stage in enumerate(self.__stages)
+            for worker in range(stage.workers)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for item in items:
+                self.__queues[0].put(item)
+        finally:
+            self.__queues[0].put(Pipeline.__END)
+
+            for thread in threads:
+                thread.join()
+
+        for stage in self.__stages:
+            print(f"Stage {stage.name}: {stage.processed} items, {stage.errors} errors, {stage.busy:.2f} s busy")
@@ -1,7 +1,10 @@
+import re
 from dataclasses import dataclass
-from typing import Any, List, cast
+from functools import lru_cache
+from typing import Any, Callable, List, cast
 
-from bs4 import BeautifulSoup, ResultSet, Tag
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, ResultSet, SoupStrainer, Tag
 
 
 @dataclass
@@ -16,19 +19,229 @@ class Content:
         return f"{self.text}\n{self.images}\n{self.videos}\n{self.links}"
 
 
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    Compile a CSS selector, only the first time it is requested.
+
+    Args:
+        selector (str): CSS selector
+    Returns:
+        soupsieve.SoupSieve
+    """
+    return soupsieve.compile(selector)
+
+
+@dataclass
+class Field:
+    """Field of an extraction schema.
+
+    Args:
+        selector (str): CSS selector of the element
+        attribute (str | None): attribute to read from the element. Its text by default
+        tag (bool): return the element itself instead of its text or attribute. False by default
+        many (bool): return a list with every matching element instead of the first one. False by default
+        required (bool): raise SchemaException when the value is missing or empty. False by default
+        process (Callable[[Any], Any] | None): function applied to the value, or to every value when many. None by default
+        default (Any): value when the element or attribute is missing. None by default
+    """
+
+    selector: str
+    attribute: str | None = None
+    tag: bool = False
+    many: bool = False
+    required: bool = False
+    process: Callable[[Any], Any] | None = None
+    default: Any = None
+
+
+class Schema:
+
+    def __init__(self, fields: dict[str, Field]) -> None:
+        """
+        Compile the selectors of a declarative extraction schema once, to apply it to many documents.
+
+        Args:
+            fields (dict[str, Field]): field name and how to extract it
+        """
+        self.__fields: dict[str, Field] = fields
+        self.__selectors: dict[str, soupsieve.SoupSieve] = {name: compile_selector(field.selector) for name, field in fields.items()}
+        self.__filters: dict[str, tuple[str | None, set[str]]] = {name: Schema.__create_filter(field.selector) for name, field in fields.items()}
+
+    @staticmethod
+    def __create_filter(selector: str) -> tuple[str | None, set[str]]:
+        # Tag and classes of the subject of a simple selector, to skip most elements without a full match
+        compound: str = re.split(r"\s*[\s>+~]\s*", selector.strip())[-1]
+
+        if "," in selector or not re.match(r"^[\w-]*(?:[.#][\w-]+)*$", compound):
+            return None, set()
+
+        name: str | None = re.match(r"^[\w-]*", compound).group(0).lower() or None  # type: ignore
+        return name, set(re.findall(r"\.([\w-]+)", compound))
+
+    @property
+    def fields(self) -> dict[str, Field]:
+        return self.__fields
+
+    def __get_value(self, field: Field, element: Tag) -> Any:
+        if field.tag:
+            return element
+        elif field.attribute:
+            value: Any = element.get(field.attribute)
+            return " ".join(value) if isinstance(value, list) else value
+        else:
+            return element.text
+
+    def __process(self, field: Field, value: Any) -> Any:
+        if value is None:
+            return field.default
+        return field.process(value) if field.process else value
+
+    def complete(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """
+        Apply defaults and processors to raw field values and check the required ones.
+
+        Args:
+            raw (dict[str, Any]): element, text or attribute found for each field, a list for many fields; None or absent when missing
+        Returns:
+            dict[str, Any]
+        """
+        values: dict[str, Any] = {}
+
+        for name, field in self.__fields.items():
+            value: Any = raw.get(name)
+
+            if field.many:
+                values[name] = [self.__process(field, item) for item in value or []]
+            else:
+                values[name] = self.__process(field, value)
+
+            if field.required and not values[name]:
+                raise SchemaException(name, f"Field {name} not found with selector {field.selector}")
+
+        return values
+
+    def extract(self, root: Tag) -> dict[str, Any]:
+        """
+        Extract every field from the descendants of root in a single walk, which ends early once every field is found when none is many.
+
+        Args:
+            root (Tag): element or soup to extract from
+        Returns:
+            dict[str, Any]; a value per field, a list for many fields
+        """
+        raw: dict[str, Any] = {name: [] for name, field in self.__fields.items() if field.many}
+        pending: dict[str, soupsieve.SoupSieve] = dict(self.__selectors)
+
+        for descendant in root.descendants:
+            if not isinstance(descendant, Tag):
+                continue
+
+            classes: Any = None
+
+            for name, selector in list(pending.items()):
+                tag_name, tag_classes = self.__filters[name]
+
+                if tag_name and tag_name != descendant.name:
+                    continue
+
+                if tag_classes:
+                    if classes is None:
+                        classes = descendant.get("class") or []
+                        classes = classes.split() if isinstance(classes, str) else classes
+                    if not tag_classes.issubset(classes):
+                        continue
+
+                if selector.match(descendant):
+                    field: Field = self.__fields[name]
+
+                    if field.many:
+                        raw[name].append(self.__get_value(field, descendant))
+                    else:
+                        raw[name] = self.__get_value(field, descendant)
+                        del pending[name]
+
+            if not pending:
+                break
+
+        return self.complete(raw)
+
+
 class Scrapper:
 
-    def __init__(self, source_code: str = "") -> None:
+    PARSERS: List[str] = ["html.parser", "lxml", "html5lib"]
+
+    __PARSE_ONLY_PATTERN: re.Pattern = re.compile(r"^([\w-]*)((?:[.#][\w-]+)*)$")
+
+    def __init__(self, source_code: str = "", parser: str = "html.parser", parse_only: str | None = None) -> None:
         """
         Create a soup to be scrapped with source code.
 
         Args:
             source_code (str): html source code to scrap
+            parser (str): Beautiful Soup parser backend: html.parser, lxml (fastest, C-backed) or html5lib (most lenient). html.parser by default
+            parse_only (str | None): simple selector of the elements to build, as tag, classes and id like div.company-detail; the rest of the document is skipped while parsing. Ignored by html5lib. None by default
         """
+        if parser not in Scrapper.PARSERS:
+            raise ValueError(f"Parser {parser} is not one of {Scrapper.PARSERS}")
+
+        self.__parser: str = parser
+        self.__parse_only: SoupStrainer | None = None
+
+        if parse_only:
+            if parser == "html5lib":
+                print(f"Parser {parser} can't parse only {parse_only}, parsing the whole document")
+            else:
+                self.__parse_only = Scrapper.create_strainer(parse_only)
+
         if source_code:
             self.set_source_code(source_code)
         else:
-            self.__soup: BeautifulSoup = BeautifulSoup("", "html.parser")
+            self.__soup: BeautifulSoup = self.__create_soup("")
+            self.__root: Tag = self.__soup
+
+    @property
+    def parser(self) -> str:
+        return self.__parser
+
+    def __create_soup(self, source: str) -> BeautifulSoup:
+        try:
+            return BeautifulSoup(source, self.__parser, parse_only=self.__parse_only)
+        except FeatureNotFound:
+            print(f"Parser {self.__parser} is not installed, using html.parser")
+            self.__parser = "html.parser"
+            return BeautifulSoup(source, self.__parser, parse_only=self.__parse_only)
+
+    @staticmethod
+    def create_strainer(selector: str) -> SoupStrainer:
+        """
+        Create a strainer that matches the elements of a simple selector made of an optional tag, classes and id.
+
+        Args:
+            selector (str): selector like div.company-detail, div.a.b or #main
+        Returns:
+            SoupStrainer
+        """
+        match: re.Match | None = Scrapper.__PARSE_ONLY_PATTERN.match(selector.strip())
+
+        if not match or not selector.strip():
+            raise ValueError(f"Selector {selector} is not a tag with classes and id")
+
+        name: str = match.group(1)
+        attrs: dict[str, Any] = {}
+        classes: set[str] = set()
+
+        for part in re.findall(r"[.#][\w-]+", match.group(2)):
+            if part[0] == "#":
+                attrs["id"] = part[1:]
+            else:
+                classes.add(part[1:])
+
+        if classes:
+            # Multi-valued classes are also matched joined by spaces, so an element with every class is accepted
+            attrs["class"] = lambda value: bool(value) and classes <= set(value.split())
+
+        return SoupStrainer(name or None, attrs)
 
     def set_source_code(self, source: str) -> None:
         """
@@ -38,7 +251,8 @@ class Scrapper:
             source (str): new source code
         """
         if not source.strip().startswith("<?xml"):
-            self.__soup = BeautifulSoup(source, "html.parser")
+            self.__soup = self.__create_soup(source)
+            self.__root = self.__soup
         else:
             print("This source is not from an HTML page")
 
@@ -49,19 +263,22 @@ class Scrapper:
         Returns:
             bool
         """
-        return bool(self.__soup.contents)
+        return bool(self.__root.contents)
 
     def print_source_code(self) -> None:
         """
         Print soup source code beautifully.
         """
-        print(self.__soup.prettify())
+        print(self.__root.prettify())
 
     def set_root(self, tag: Tag) -> None:
         """
-        Set the source code of tag as the soup.
+        Scope the following searches and deletions to the descendants of tag, without copying nor parsing it again.
+
+        Args:
+            tag (Tag): new root; it must belong to the current soup
         """
-        self.set_source_code(str(tag))
+        self.__root = tag
 
     def delete_tags(self, tags: List[str] | str) -> None:
         """
@@ -74,7 +291,7 @@ class Scrapper:
             tags = [tags]
 
         for tag in tags:
-            for element in self.__soup.find_all(tag):
+            for element in self.__root.find_all(tag):
                 if isinstance(element, Tag):
                     cast(Tag, element).decompose()
 
@@ -103,7 +320,7 @@ class Scrapper:
         if element:
             return element.find_all(tags, recursive=recursive, **kwargs)
         else:
-            return self.__soup.find_all(tags, recursive=recursive, **kwargs)
+            return self.__root.find_all(tags, recursive=recursive, **kwargs)
 
     # @print_class_name
     def find_one(self, tag: str, classes: List[str] | str | None = None, element: Tag | None = None, recursive: bool = True) -> Tag | None:
@@ -130,49 +347,97 @@ class Scrapper:
         if element:
             return cast(Tag, element.find(tag, recursive=recursive, **kwargs))
         else:
-            return cast(Tag, self.__soup.find(tag, recursive=recursive, **kwargs))
+            return cast(Tag, self.__root.find(tag, recursive=recursive, **kwargs))
 
-    def get_content(self, tag: Tag) -> Content:
+    def select(self, selector: str, element: Tag | None = None, limit: int = 0) -> List[Tag]:
         """
-        Create a text representation of a tag content.
+        Select the elements that match a CSS selector on source code or element. Selectors are compiled once and reused.
 
         Args:
-            tag (str): elements tag
+            selector (str): CSS selector
+            element (Tag | None): element to search if given. None by default
+            limit (int): maximum number of elements, 0 for all. 0 by default
+        Returns:
+            List[Tag]
+        """
+        return compile_selector(selector).select(element if element is not None else self.__root, limit)
+
+    def select_one(self, selector: str, element: Tag | None = None) -> Tag | None:
+        """
+        Select the first element that matches a CSS selector on source code or element. Selectors are compiled once and reused.
+
+        Args:
+            selector (str): CSS selector
+            element (Tag | None): element to search if given. None by default
         Returns:
             Tag | None
         """
+        return compile_selector(selector).select_one(element if element is not None else self.__root)
+
+    def extract(self, schema: Schema, element: Tag | None = None) -> dict[str, Any]:
+        """
+        Extract the fields of a compiled schema from source code or element.
 
-        # This method requires to be optimized
-
-        text: str = ""
-        images: str = ""
-        videos: str = ""
-        links: str = ""
-
-        text += "TEXT\n"
-        text += tag.get_text(separator=" ", strip=True)
-        text = text.strip()
-        text = " ".join(text.split())
-
-        # Adding images
-        images_element: ResultSet[Any] = tag.find_all("img", src=True, recursive=True)
-        if len(images_element) > 0:
-            images += f"IMAGES"
-            for image in images_element:
-                images += f"\nImage: {image["src"]}"
-
-        # Adding videos
-        videos_element: ResultSet[Any] = tag.find_all("video", src=True, recursive=True)
-        if len(videos_element) > 0:
-            videos += f"VIDEOS"
-            for video in videos_element:
-                videos += f"\nVideo: {video["src"]}"
-
-        # Adding links
-        links_element: ResultSet[Any] = tag.find_all("a", href=True, recursive=True)
-        if len(links_element) > 0:
-            links += f"LINKS"
-            for link in links_element:
-                links += f"\nLink: {link["href"]}"
-
-        return Content(text, images, videos, links)
+        Args:
+            schema (Schema): compiled extraction schema
+            element (Tag | None): element to extract from if given. None by default
+        Returns:
+            dict[str, Any]
+        """
+        return schema.extract(element if element is not None else self.__root)
+
+    @staticmethod
+    def get_content(tag: Tag) -> Content:
+        """
+        Create a text representation of a tag content in a single walk over its descendants.
+
+        Args:
+            tag (Tag): element whose text, images, videos and links are collected
+        Returns:
+            Content
+        """
+        # Same strings as tag.get_text: only the types the tag considers interesting, so no comments nor scripts
+        types: Any = tag.interesting_string_types
+
+        words: List[str] = ["TEXT"]
+        images: List[str] = ["IMAGES"]
+        videos: List[str] = ["VIDEOS"]
+        links: List[str] = ["LINKS"]
+
+        for descendant in tag.descendants:
+            if isinstance(descendant, Tag):
+                if descendant.name == "img":
+                    source: Any = descendant.get("src")
+                    if source is not None:
+                        images.append(f"Image: {source}")
+                elif descendant.name == "video":
+                    source = descendant.get("src")
+                    if source is not None:
+                        videos.append(f"Video: {source}")
+                elif descendant.name == "a":
+                    reference: Any = descendant.get("href")
+                    if reference is not None:
+                        links.append(f"Link: {reference}")
+            elif isinstance(descendant, NavigableString) and (type(descendant) is types if isinstance(types, type) else type(descendant) in types):
+                words.extend(descendant.split())
+
+        return Content(
+            " ".join(words),
+            "\n".join(images) if len(images) > 1 else "",
+            "\n".join(videos) if len(videos) > 1 else "",
+            "\n".join(links) if len(links) > 1 else "",
+        )
+
+
+class SchemaException(Exception):
+    """Exception raised when a required schema field is not found.
+
+    Args:
+        field (str): field name
+        message (str): exception reason
+    """
+
+    def __init__(self, field: str, message: str) -> None:
+        self.field: str = field
+        self.message: str = message
+        super().__init__(message)
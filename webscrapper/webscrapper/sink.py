@@ -0,0 +1,223 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, List
+
+from webscrapper.excel import Excel
+from webscrapper.utils import Files, print_class_name
+
+
+class Sink(ABC):
+
+    def __init__(self, name: str, columns: List[str], key: str, batch_size: int = 50, flush_seconds: float = 30, on_flush: Callable[[List[dict[str, Any]]], None] | None = None) -> None:
+        """
+        Create a store where records are appended and flushed in batches.
+
+        Args:
+            name (str): store name at package parent folder, without extension
+            columns (List[str]): record fields, in export order
+            key (str): field that identifies a record; the last record written with a key replaces the previous ones
+            batch_size (int): records kept in memory before flushing. 50 by default
+            flush_seconds (float): maximum seconds a record is kept in memory before flushing. 30 s by default
+            on_flush (Callable[[List[dict[str, Any]]], None] | None): function called with every batch once it is persisted. None by default
+        """
+        self._name: str = name
+        self._columns: List[str] = columns
+        self._key: str = key
+        self.__batch_size: int = batch_size
+        self.__flush_seconds: float = flush_seconds
+        self.__on_flush: Callable[[List[dict[str, Any]]], None] | None = on_flush
+        self.__buffer: List[dict[str, Any]] = []
+        self.__timer: threading.Timer | None = None
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Append a record, flushing the batch when it is full. The first record of a batch starts a timer that flushes it after flush_seconds, even if no more records arrive.
+
+        Args:
+            record (dict[str, Any]): record with the sink columns
+        """
+        with self.__lock:
+            self.__buffer.append(record)
+
+            if len(self.__buffer) >= self.__batch_size:
+                self.__flush()
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__flush_seconds, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def flush(self) -> None:
+        """
+        Persist the records kept in memory.
+        """
+        with self.__lock:
+            self.__flush()
+
+    def __flush(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        if self.__buffer:
+            self._write_batch(self.__buffer)
+            if self.__on_flush:
+                self.__on_flush(self.__buffer)
+            self.__buffer = []
+
+    @abstractmethod
+    def _write_batch(self, records: List[dict[str, Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def read(self) -> Iterator[dict[str, Any]]:
+        """
+        Return the persisted records, only the last one written for each key, in order of first appearance.
+
+        Returns:
+            Iterator[dict[str, Any]]
+        """
+        pass
+
+    def clear(self) -> None:
+        """
+        Delete every record, persisted or kept in memory.
+        """
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            self.__buffer = []
+            self._clear()
+
+    @abstractmethod
+    def _clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """
+        Flush the records kept in memory and close the store.
+        """
+        self.flush()
+
+    @print_class_name
+    def export(self, book_name: str, sheet_name: Callable[[dict[str, Any]], str] | None = None, sort_by: str | None = None) -> None:
+        """
+        Write all records to an Excel book at package parent folder in a single pass with a write-only workbook.
+
+        Args:
+            book_name (str): book name without extension
+            sheet_name (Callable[[dict[str, Any]], str] | None): function that returns the sheet of a record. Every record to sheet "0" by default
+            sort_by (str | None): column used to sort records inside each sheet. None by default
+        """
+        print(f"Exporting {self._name} to Excel book {book_name}")
+
+        self.flush()
+
+        sheets: dict[str, List[dict[str, Any]]] = {}
+
+        for record in self.read():
+            sheets.setdefault(sheet_name(record) if sheet_name else "0", []).append(record)
+
+        excel: Excel = Excel(book_name, write_only=True)
+
+        for name, records in sheets.items():
+            if sort_by:
+                records.sort(key=lambda record: record[sort_by])
+
+            excel.create_sheet(name)
+            excel.append_rows(name, [self._columns])
+            excel.append_rows(name, ([record.get(column) for column in self._columns] for record in records))
+
+        excel.save_book()
+        excel.close()
+
+
+class JsonLinesSink(Sink):
+
+    def __init__(self, name: str, columns: List[str], key: str, batch_size: int = 50, flush_seconds: float = 30, on_flush: Callable[[List[dict[str, Any]]], None] | None = None) -> None:
+        """
+        Create a JSON Lines file sink. Every flush appends the batch and syncs the file to disk, so a crash loses at most the records of the last flush_seconds kept in memory.
+
+        Args:
+            name (str): file name at package parent folder, without extension
+            columns (List[str]): record fields, in export order
+            key (str): field that identifies a record
+            batch_size (int): records kept in memory before flushing. 50 by default
+            flush_seconds (float): maximum seconds a record is kept in memory before flushing. 30 s by default
+            on_flush (Callable[[List[dict[str, Any]]], None] | None): function called with every batch once it is persisted. None by default
+        """
+        super().__init__(name, columns, key, batch_size, flush_seconds, on_flush)
+        self.__path: str = Files.create_path_outside(f"{name}.jsonl")
+
+    def _write_batch(self, records: List[dict[str, Any]]) -> None:
+        with open(file=self.__path, mode="a", encoding="utf8") as file:
+            file.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _clear(self) -> None:
+        open(file=self.__path, mode="w", encoding="utf8").close()
+
+    def read(self) -> Iterator[dict[str, Any]]:
+        records: dict[Any, dict[str, Any]] = {}
+
+        if os.path.exists(self.__path):
+            with open(file=self.__path, mode="r", encoding="utf8") as file:
+                for line in file:
+                    try:
+                        record: dict[str, Any] = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Line cut by a crash in the middle of a write
+                        continue
+                    records[record.get(self._key)] = record
+
+        return iter(records.values())
+
+
+class SqliteSink(Sink):
+
+    def __init__(self, name: str, columns: List[str], key: str, batch_size: int = 50, flush_seconds: float = 30, on_flush: Callable[[List[dict[str, Any]]], None] | None = None) -> None:
+        """
+        Create a SQLite sink in WAL mode. Every flush upserts the batch in a single transaction.
+
+        Args:
+            name (str): database name at package parent folder, without extension
+            columns (List[str]): record fields, in export order
+            key (str): field that identifies a record
+            batch_size (int): records kept in memory before flushing. 50 by default
+            flush_seconds (float): maximum seconds a record is kept in memory before flushing. 30 s by default
+            on_flush (Callable[[List[dict[str, Any]]], None] | None): function called with every batch once it is persisted. None by default
+        """
+        super().__init__(name, columns, key, batch_size, flush_seconds, on_flush)
+        self.__connection: sqlite3.Connection = sqlite3.connect(Files.create_path_outside(f"{name}.sqlite"), check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        self.__connection.commit()
+
+    def _write_batch(self, records: List[dict[str, Any]]) -> None:
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO records (key, data) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET data = excluded.data",
+                [(str(record.get(self._key)), json.dumps(record, ensure_ascii=False)) for record in records],
+            )
+
+    def _clear(self) -> None:
+        with self.__connection:
+            self.__connection.execute("DELETE FROM records")
+
+    def read(self) -> Iterator[dict[str, Any]]:
+        for (data,) in self.__connection.execute("SELECT data FROM records ORDER BY rowid"):
+            yield json.loads(data)
+
+    def close(self) -> None:
+        super().close()
+        self.__connection.close()
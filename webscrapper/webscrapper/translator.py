@@ -1,18 +1,133 @@
 import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Sequence
 
-from google.cloud import translate_v2  # type: ignore
-from google.cloud.translate_v2 import Client  # type: ignore
-
+from webscrapper.memory import TranslationMemory
 from webscrapper.utils import Files
 
 
+class TranslationBackend(ABC):
+
+    def __init__(self, max_segments: int, max_characters: int) -> None:
+        """
+        Create a translation service client.
+
+        Args:
+            max_segments (int): maximum texts per request
+            max_characters (int): maximum characters per request
+        """
+        self.__max_segments: int = max_segments
+        self.__max_characters: int = max_characters
+
+    @property
+    def max_segments(self) -> int:
+        return self.__max_segments
+
+    @property
+    def max_characters(self) -> int:
+        return self.__max_characters
+
+    @abstractmethod
+    def translate(self, texts: List[str], source: str, target: str) -> List[str]:
+        """
+        Translate texts with a single request.
+
+        Args:
+            texts (List[str]): texts within the request limits
+            source (str): source language code
+            target (str): target language code
+        Returns:
+            List[str]; translations in the same order as texts
+        """
+        pass
+
+
+class GoogleBackend(TranslationBackend):
+
+    def __init__(self, max_segments: int = 128, max_characters: int = 30_000) -> None:
+        """
+        Create a Google Cloud Translation v2 client with the credentials at google-translate-credentials file.
+
+        Args:
+            max_segments (int): maximum texts per request. 128 by default
+            max_characters (int): maximum characters per request. 30,000 by default
+        """
+        super().__init__(max_segments, max_characters)
+
+        # Imported here so other backends work without Google packages nor credentials
+        from google.cloud import translate_v2  # type: ignore
+
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = Files.create_path_inside("data\\google-translate-credentials.json")
+        self.__client: Any = translate_v2.Client()
+
+    def translate(self, texts: List[str], source: str, target: str) -> List[str]:
+        results: List[dict] = self.__client.translate(texts, source_language=source, target_language=target)
+        return [result["translatedText"] for result in results]
+
+
+class LocalBackend(TranslationBackend):
+
+    def __init__(self, latency: float = 0, max_segments: int = 128, max_characters: int = 30_000) -> None:
+        """
+        Create a deterministic offline stand-in that returns every text prefixed with the target language, to measure the translation stage without the live service.
+
+        Args:
+            latency (float): seconds each request takes. 0 s by default
+            max_segments (int): maximum texts per request. 128 by default
+            max_characters (int): maximum characters per request. 30,000 by default
+        """
+        super().__init__(max_segments, max_characters)
+        self.__latency: float = latency
+        self.__requests: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        return self.__requests
+
+    def translate(self, texts: List[str], source: str, target: str) -> List[str]:
+        if len(texts) > self.max_segments or sum(len(text) for text in texts) > self.max_characters:
+            raise ValueError(f"Request of {len(texts)} texts exceeds the limits of {self.max_segments} texts and {self.max_characters} characters")
+
+        with self.__lock:
+            self.__requests += 1
+
+        if self.__latency:
+            time.sleep(self.__latency)
+
+        return [f"[{target}] {text}" for text in texts]
+
+
 class Translator:
 
-    def __init__(self, source: str, target: str) -> None:
+    # Languages written without spaces between sentences
+    UNSPACED_LANGUAGES: List[str] = ["zh", "ja", "th", "lo", "km", "my"]
+
+    __SEPARATOR_PATTERN: re.Pattern = re.compile(r"((?<=[。！？!?;；])\s*|(?<=\.)\s+|\n\s*)")
+
+    def __init__(self, source: str, target: str, workers: int = 4, memory: TranslationMemory | None = None, backend: TranslationBackend | None = None, segment_length: int = 500) -> None:
+        """
+        Create a translator between two languages.
+
+        Args:
+            source (str): source language code
+            target (str): target language code
+            workers (int): requests sent at the same time by translate_batch. 4 by default
+            memory (TranslationMemory | None): store of translations consulted before calling the backend. None by default
+            backend (TranslationBackend | None): translation service. GoogleBackend by default
+            segment_length (int): texts longer than this are translated sentence by sentence, so sentences shared by many texts are translated once. 500 characters by default
+        """
         self.__source_language: str = source
         self.__target_language: str = target
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = Files.create_path_inside("data\\google-translate-credentials.json")
-        self.__client: Client = translate_v2.Client()
+        self.__workers: int = workers
+        self.__memory: TranslationMemory | None = memory
+        self.__backend: TranslationBackend = backend if backend is not None else GoogleBackend()
+        self.__segment_length: int = segment_length
+        self.__spaced: bool = target.split("-")[0].lower() not in Translator.UNSPACED_LANGUAGES
 
     @property
     def source(self) -> str:
@@ -22,11 +137,111 @@ class Translator:
     def target(self) -> str:
         return self.__target_language
 
+    @property
+    def backend(self) -> TranslationBackend:
+        return self.__backend
+
     def translate(self, text: str | bytes) -> str:
 
         if isinstance(text, bytes):
             text = text.decode("utf-8")
 
-        result: dict = self.__client.translate(text, source_language=self.__source_language, target_language=self.__target_language)
+        if self.__memory is not None:
+            return self.translate_batch([text])[0]
+
+        return self.__backend.translate([text], self.__source_language, self.__target_language)[0]
+
+    def translate_batch(self, texts: Sequence[str | bytes]) -> List[str]:
+        """
+        Translate many texts with as few requests as possible: long texts are split in sentences, identical sentences and texts are translated once, the ones in the translation memory are not sent, and the rest are grouped in chunks within the backend limits of segments and characters per request, sent concurrently.
+
+        Args:
+            texts (Sequence[str | bytes]): texts to translate
+        Returns:
+            List[str]; translations in the same order as texts; empty texts are kept empty
+        """
+        decoded: List[str] = [text.decode("utf-8") if isinstance(text, bytes) else text for text in texts]
+        segmented: List[List[str]] = [self.segment(text) if len(text) > self.__segment_length else [text] for text in decoded]
+        sentences: List[str] = [sentence for pieces in segmented for sentence in (piece.strip() for piece in pieces[::2]) if sentence]
+        translations: dict[str, str] = self.__translate_unique(list(dict.fromkeys(sentences)))
+
+        return [self.__join(pieces, translations) for pieces in segmented]
+
+    def segment(self, text: str) -> List[str]:
+        """
+        Split text in sentences, at sentence punctuation and new lines, keeping the separators. Sentences longer than the backend limit are cut.
+
+        Args:
+            text (str): text to split
+        Returns:
+            List[str]; sentences at even indexes and their separators at odd indexes, so joining them gives back text
+        """
+        pieces: List[str] = []
+        limit: int = self.__backend.max_characters
+
+        for index, piece in enumerate(Translator.__SEPARATOR_PATTERN.split(text)):
+            if index % 2 or len(piece) <= limit:
+                pieces.append(piece)
+            else:
+                for start in range(0, len(piece), limit):
+                    if start:
+                        pieces.append("")
+                    pieces.append(piece[start : start + limit])
+
+        return pieces
+
+    def __join(self, pieces: List[str], translations: dict[str, str]) -> str:
+        result: List[str] = []
+
+        for index, piece in enumerate(pieces):
+            if index % 2:
+                # Sentences joined without spaces in the source need one in spaced target languages
+                spaced: bool = self.__spaced and not piece and bool(pieces[index - 1].strip()) and bool(pieces[index + 1].strip())
+                result.append(" " if spaced else piece)
+            else:
+                sentence: str = piece.strip()
+                if sentence:
+                    start: int = piece.index(sentence)
+                    result.append(piece[:start] + translations.get(sentence, sentence) + piece[start + len(sentence) :])
+                else:
+                    result.append(piece)
+
+        return "".join(result)
+
+    def __translate_unique(self, unique: List[str]) -> dict[str, str]:
+        translations: dict[str, str] = {}
+
+        if self.__memory is not None and unique:
+            translations = self.__memory.get(self.__source_language, self.__target_language, unique)
+            unique = [text for text in unique if text not in translations]
+
+        if unique:
+            chunks: List[List[str]] = list(self.__chunk(unique))
+
+            with ThreadPoolExecutor(max_workers=min(self.__workers, len(chunks)), thread_name_prefix="translator") as executor:
+                for chunk, results in zip(chunks, executor.map(self.__translate_chunk, chunks)):
+                    translations.update(zip(chunk, results))
+
+                    if self.__memory is not None:
+                        self.__memory.put(self.__source_language, self.__target_language, dict(zip(chunk, results)))
+
+        return translations
+
+    def __translate_chunk(self, chunk: List[str]) -> List[str]:
+        return self.__backend.translate(chunk, self.__source_language, self.__target_language)
+
+    def __chunk(self, texts: List[str]) -> Iterator[List[str]]:
+        chunk: List[str] = []
+        characters: int = 0
+
+        for text in texts:
+            if chunk and (len(chunk) == self.__backend.max_segments or characters + len(text) > self.__backend.max_characters):
+                yield chunk
+                chunk = []
+                characters = 0
+
+            chunk.append(text)
+            characters += len(text)
 
-        return result["translatedText"]
+        if chunk:
+            yield chunk